@@ -4,6 +4,8 @@ Flexible test runner for cross-Python version compatibility.
 This script runs tests with error handling for version-specific issues.
 """
 
+import importlib.util
+import os
 import subprocess
 import sys
 
@@ -23,8 +25,17 @@ def run_tests():
         "--cov-report=term-missing",
         "--tb=short",
         "-v",
+        # Skip plugins a one-off CI run does not use
+        "-p",
+        "no:cacheprovider",
+        "-p",
+        "no:doctest",
     ]
 
+    # Test files are independent, so spread them over workers when available
+    if importlib.util.find_spec("xdist") is not None:
+        cmd.extend(["-n", "auto", "--dist=loadfile"])
+
     # Add version-specific flags
     if sys.version_info >= (3, 11):
         print("✅ Using Python 3.11+ configuration")
@@ -35,7 +46,8 @@ def run_tests():
 
     try:
         # Run the tests
-        result = subprocess.run(cmd, check=False)
+        env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+        result = subprocess.run(cmd, check=False, env=env)
 
         if result.returncode == 0:
             print("✅ All tests passed!")
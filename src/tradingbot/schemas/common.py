@@ -4,9 +4,9 @@ Contains base schemas, pagination, and shared response models.
 """
 
 from datetime import datetime
-from typing import Generic, List, Optional, TypeVar
+from typing import Generic, List, Literal, Optional, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 T = TypeVar("T")
 
@@ -30,10 +30,13 @@ class ErrorResponse(BaseResponse):
 class PaginationParams(BaseModel):
     """Pagination parameters for list endpoints."""
 
+    # Immutable so identical parameters can share one instance
+    model_config = ConfigDict(frozen=True)
+
     page: int = Field(1, ge=1, description="Page number")
     size: int = Field(20, ge=1, le=100, description="Page size")
     sort_by: Optional[str] = Field(None, description="Sort field")
-    sort_order: str = Field("asc", pattern="^(asc|desc)$", description="Sort order")
+    sort_order: Literal["asc", "desc"] = Field("asc", description="Sort order")
 
 
 class PaginatedResponse(BaseResponse, Generic[T]):
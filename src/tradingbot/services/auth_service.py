@@ -21,6 +21,7 @@ from tradingbot.schemas.user import (
     TokenResponse,
     UserResponse,
 )
+from tradingbot.utils.user_cache import invalidate_user_cache
 
 settings = get_settings()
 security = HTTPBearer()
@@ -212,10 +213,13 @@ class AuthService:
                 .first()
             )
 
-            if db_session:
-                session.delete(db_session)
-                return True
-            return False
+            if not db_session:
+                return False
+            user_id = db_session.user_id
+            session.delete(db_session)
+
+        invalidate_user_cache(user_id)
+        return True
 
     def logout_all_sessions(self, user_id: str) -> int:
         """Logout user from all sessions."""
@@ -225,7 +229,9 @@ class AuthService:
                 .filter(UserSession.user_id == user_id)
                 .delete()
             )
-            return count
+
+        invalidate_user_cache(user_id)
+        return count
 
     def get_current_user(self, token: str) -> User:
         """Get current user from access token."""
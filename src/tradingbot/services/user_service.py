@@ -11,6 +11,7 @@ from fastapi import HTTPException, status
 from tradingbot.models.user import User, UserSettings
 from tradingbot.schemas.user import UserCreate, UserSettingsUpdate, UserUpdate
 from tradingbot.services.auth_service import auth_service
+from tradingbot.utils.user_cache import invalidate_user_cache
 from sqlalchemy.orm import Session
 
 # Constants
@@ -152,7 +153,8 @@ class UserService:
                 if hasattr(user, field):
                     setattr(user, field, value)
 
-            return user
+        invalidate_user_cache(user_id)
+        return user
 
     def delete_user(self, user_id: str) -> bool:
         """Delete a user."""
@@ -164,7 +166,9 @@ class UserService:
                 )
 
             session.delete(user)
-            return True
+
+        invalidate_user_cache(user_id)
+        return True
 
     def get_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         """Get list of users with pagination."""
@@ -236,7 +240,9 @@ class UserService:
                 )
 
             user.is_active = True
-            return True
+
+        invalidate_user_cache(user_id)
+        return True
 
     def deactivate_user(self, user_id: str) -> bool:
         """Deactivate a user account (admin only)."""
@@ -248,7 +254,9 @@ class UserService:
                 )
 
             user.is_active = False
-            return True
+
+        invalidate_user_cache(user_id)
+        return True
 
     def make_admin(self, user_id: str) -> bool:
         """Give admin privileges to a user (admin only)."""
@@ -260,7 +268,9 @@ class UserService:
                 )
 
             user.is_admin = True
-            return True
+
+        invalidate_user_cache(user_id)
+        return True
 
     def remove_admin(self, user_id: str) -> bool:
         """Remove admin privileges from a user (admin only)."""
@@ -272,7 +282,9 @@ class UserService:
                 )
 
             user.is_admin = False
-            return True
+
+        invalidate_user_cache(user_id)
+        return True
 
 
 # Global user service instance
@@ -3,7 +3,7 @@ Strategies package for the Crypto Trading Bot.
 Contains the strategy engine, indicators, and strategy implementations.
 """
 
-from .base_strategy import BaseStrategy
+from .base_strategy import BaseStrategy, SignalResult
 
 # Import all strategy implementations to register them
 from .implementations import (
@@ -26,6 +26,7 @@ registry.discover_strategies("src.backend.strategies.implementations")
 
 __all__ = [
     "BaseStrategy",
+    "SignalResult",
     "TechnicalIndicators",
     "registry",
     "register_strategy",
@@ -7,14 +7,25 @@ import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from .indicators.cache import IndicatorCache
+
 logger = logging.getLogger(__name__)
 
 
+class SignalResult(NamedTuple):
+    """Signals and risk levels as bare arrays, without the indicator columns."""
+
+    signal: np.ndarray
+    strength: np.ndarray
+    stop_loss: np.ndarray
+    take_profit: np.ndarray
+
+
 class BaseStrategy(ABC):
     """
     Abstract base class for all trading strategies.
@@ -23,16 +34,27 @@ class BaseStrategy(ABC):
     and provides common functionality for data processing and signal management.
     """
 
-    def __init__(self, name: str, params: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        name: str,
+        params: Optional[Dict[str, Any]] = None,
+        indicator_cache: Optional[IndicatorCache] = None,
+    ):
         """
         Initialize the strategy.
 
         Args:
             name: Strategy name
             params: Strategy parameters dictionary
+            indicator_cache: Cache for indicator results; pass the same cache
+                to strategies run on the same data to share results (defaults
+                to a cache private to this strategy)
         """
         self.name = name
         self.params = params or {}
+        self.indicator_cache = (
+            indicator_cache if indicator_cache is not None else IndicatorCache()
+        )
         self.logger = logging.getLogger(f"strategy.{name}")
         self._last_signal = None
         self._last_processed_time = None
@@ -213,6 +235,65 @@ class BaseStrategy(ABC):
 
         return data
 
+    @staticmethod
+    def _append_columns(data: pd.DataFrame, columns: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Append computed columns to a DataFrame in a single operation.
+
+        Building the new columns as one frame and concatenating avoids the
+        block consolidation triggered by assigning many columns one at a time.
+
+        Args:
+            data: Input DataFrame
+            columns: Mapping of column name to array-like of len(data)
+
+        Returns:
+            DataFrame with the computed columns, replacing existing ones
+        """
+        computed = pd.DataFrame(columns, index=data.index)
+        overlap = data.columns.intersection(computed.columns)
+        if len(overlap):
+            data = data.drop(columns=overlap)
+        return pd.concat([data, computed], axis=1)
+
+    @staticmethod
+    def _pct_change(values: np.ndarray, periods: int = 1) -> np.ndarray:
+        """
+        Percentage change over a number of periods on a raw array.
+
+        Args:
+            values: Price array
+            periods: Number of periods to look back
+
+        Returns:
+            Array of the same length, NaN for the first ``periods`` entries
+        """
+        result = np.empty(len(values), dtype=np.float64)
+        result[:periods] = np.nan
+        tail = result[periods:]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(values[periods:], values[:-periods], out=tail)
+        np.subtract(tail, 1.0, out=tail)
+        return result
+
+    @staticmethod
+    def _diff(values: np.ndarray, periods: int = 1) -> np.ndarray:
+        """
+        Difference over a number of periods on a raw array.
+
+        Args:
+            values: Floating point array
+            periods: Number of periods to look back
+
+        Returns:
+            Array of the same length and dtype, NaN for the first ``periods``
+            entries
+        """
+        result = np.empty_like(values)
+        result[:periods] = np.nan
+        np.subtract(values[periods:], values[:-periods], out=result[periods:])
+        return result
+
     def _filter_signals(self, signals: pd.DataFrame) -> pd.DataFrame:
         """
         Filter and clean signals to avoid noise.
@@ -136,7 +136,7 @@ class BollingerBandsStrategy(BaseStrategy):
         )
 
         # Mean reversion strength (how far from center)
-        df["mean_reversion_strength"] = abs(df["close"] - df["bb_middle"]) / (
+        df["mean_reversion_strength"] = (df["close"] - df["bb_middle"]).abs() / (
             df["bb_upper"] - df["bb_middle"]
         )
 
@@ -83,14 +83,17 @@ class MovingAverageCrossoverStrategy(BaseStrategy):
         df["signal"] = 0
 
         # Generate crossover signals
+        prev_fast_ma = df["fast_ma"].shift(1)
+        prev_slow_ma = df["slow_ma"].shift(1)
+
         # Buy signal: Fast MA crosses above Slow MA
         bullish_crossover = (df["fast_ma"] > df["slow_ma"]) & (
-            df["fast_ma"].shift(1) <= df["slow_ma"].shift(1)
+            prev_fast_ma <= prev_slow_ma
         )
 
         # Sell signal: Fast MA crosses below Slow MA
         bearish_crossover = (df["fast_ma"] < df["slow_ma"]) & (
-            df["fast_ma"].shift(1) >= df["slow_ma"].shift(1)
+            prev_fast_ma >= prev_slow_ma
         )
 
         df.loc[bullish_crossover, "signal"] = 1
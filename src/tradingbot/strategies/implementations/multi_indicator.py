@@ -2,15 +2,228 @@
 Multi-Indicator Strategy implementation.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import itertools
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
+from numba import njit
 
-from ..base_strategy import BaseStrategy
-from ..indicators import TechnicalIndicators
+from ..base_strategy import BaseStrategy, SignalResult
+from ..indicators import IndicatorCache, TechnicalIndicators
 from ..registry import register_strategy
 
+# Number of set bits for every 4-bit value, used to count packed confirmations.
+# Signed, so differences of the exposed counts cannot wrap around.
+_POPCOUNT_LUT = np.array([bin(i).count("1") for i in range(16)], dtype=np.int8)
+
+# Indicator flags in bit order of the packed confirmation masks
+_SIGNAL_FLAGS = ("rsi", "macd", "bb", "macd_momentum")
+
+# Bits of the flags that do not depend on any signal threshold
+_FIXED_FLAGS_MASK = 0b1110
+
+# Parameters that only affect signal thresholds, not indicator values
+_GRID_PARAMETERS = (
+    "rsi_oversold",
+    "rsi_overbought",
+    "volume_threshold",
+    "min_confirmations",
+)
+
+
+@njit(cache=True)
+def _bar_signal(
+    close,
+    rsi,
+    prev_rsi,
+    macd,
+    prev_macd,
+    macd_sig,
+    prev_macd_sig,
+    hist,
+    prev_hist,
+    bb_upper,
+    bb_lower,
+    vol_ratio,
+    rsi_os,
+    rsi_ob,
+    vol_thr,
+    min_conf,
+):
+    """
+    Evaluate the signal rules for one bar given the previous bar's indicators.
+
+    Previous values are NaN for the first bar, which disables crossovers.
+
+    Returns:
+        Tuple of (signal, signal strength, bullish flag bits, bearish flag bits),
+        flag bits being laid out as in ``_SIGNAL_FLAGS``
+    """
+    # RSI crossing back out of the oversold/overbought zones
+    rsi_b = rsi > rsi_os and prev_rsi <= rsi_os
+    rsi_s = rsi < rsi_ob and prev_rsi >= rsi_ob
+
+    # MACD line crossing the signal line
+    macd_b = macd > macd_sig and prev_macd <= prev_macd_sig
+    macd_s = macd < macd_sig and prev_macd >= prev_macd_sig
+
+    # Near or beyond the Bollinger Bands, with RSI confirmation
+    bb_b = close <= bb_lower * 1.001 and rsi < 40
+    bb_s = close >= bb_upper * 0.999 and rsi > 60
+
+    # MACD histogram momentum
+    mom_b = hist > prev_hist
+    mom_s = hist < prev_hist
+
+    bull_bits = rsi_b | (macd_b << 1) | (bb_b << 2) | (mom_b << 3)
+    bear_bits = rsi_s | (macd_s << 1) | (bb_s << 2) | (mom_s << 3)
+    bull_cnt = rsi_b + macd_b + bb_b + mom_b
+    bear_cnt = rsi_s + macd_s + bb_s + mom_s
+
+    signal = 0
+    strength = 0
+    if vol_ratio > vol_thr:
+        # Sell takes precedence when both sides are confirmed
+        if bear_cnt >= min_conf and rsi > 20:  # Avoid selling when oversold
+            signal = -1
+            strength = bear_cnt
+        elif bull_cnt >= min_conf and rsi < 80:  # Avoid buying when overbought
+            signal = 1
+            strength = bull_cnt
+
+    return signal, strength, bull_bits, bear_bits
+
+
+@njit(cache=True)
+def _compute_all_signals(
+    close,
+    rsi,
+    macd,
+    macd_sig,
+    macd_hist,
+    bb_upper,
+    bb_lower,
+    vol_ratio,
+    rsi_os,
+    rsi_ob,
+    vol_thr,
+    min_conf,
+):
+    """
+    Compute individual and combined signals in a single pass.
+
+    Returns:
+        Tuple of (signal, signal strength, bullish flag bits, bearish flag bits)
+        arrays, see ``_bar_signal``
+    """
+    n = close.shape[0]
+    signal = np.zeros(n, dtype=np.int8)
+    strength = np.zeros(n, dtype=np.int8)
+    bull_bits = np.zeros(n, dtype=np.uint8)
+    bear_bits = np.zeros(n, dtype=np.uint8)
+
+    prev_rsi = prev_macd = prev_macd_sig = prev_hist = np.nan
+    for i in range(n):
+        signal[i], strength[i], bull_bits[i], bear_bits[i] = _bar_signal(
+            close[i],
+            rsi[i],
+            prev_rsi,
+            macd[i],
+            prev_macd,
+            macd_sig[i],
+            prev_macd_sig,
+            macd_hist[i],
+            prev_hist,
+            bb_upper[i],
+            bb_lower[i],
+            vol_ratio[i],
+            rsi_os,
+            rsi_ob,
+            vol_thr,
+            min_conf,
+        )
+        prev_rsi = rsi[i]
+        prev_macd = macd[i]
+        prev_macd_sig = macd_sig[i]
+        prev_hist = macd_hist[i]
+
+    return signal, strength, bull_bits, bear_bits
+
+
+class _RollingWindow:
+    """Fixed-size ring buffer keeping a running sum and sum of squares."""
+
+    __slots__ = ("size", "values", "pos", "count", "total", "total_sq")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values = [0.0] * size
+        self.pos = 0
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def push(self, value: float) -> None:
+        """Add a value, evicting the oldest one once the window is full."""
+        if self.count == self.size:
+            oldest = self.values[self.pos]
+            self.total -= oldest
+            self.total_sq -= oldest * oldest
+        else:
+            self.count += 1
+        self.values[self.pos] = value
+        self.pos = (self.pos + 1) % self.size
+        self.total += value
+        self.total_sq += value * value
+
+    def mean(self) -> float:
+        """Window mean, NaN until the window is full."""
+        if self.count < self.size:
+            return np.nan
+        return self.total / self.size
+
+    def std(self) -> float:
+        """Sample standard deviation, NaN until the window is full."""
+        if self.count < self.size or self.size < 2:
+            return np.nan
+        var = (self.total_sq - self.total * self.total / self.size) / (self.size - 1)
+        return float(np.sqrt(max(var, 0.0)))
+
+
+class _StreamState:
+    """Incremental indicator state for ``MultiIndicatorStrategy.update``."""
+
+    def __init__(self, strategy: "MultiIndicatorStrategy"):
+        self.alpha_fast = 2.0 / (strategy.macd_fast + 1)
+        self.alpha_slow = 2.0 / (strategy.macd_slow + 1)
+        self.alpha_signal = 2.0 / (strategy.macd_signal + 1)
+
+        self.rsi_gain = _RollingWindow(strategy.rsi_period)
+        self.rsi_loss = _RollingWindow(strategy.rsi_period)
+        self.bb = _RollingWindow(strategy.bb_period)
+        self.volume = _RollingWindow(20)
+        self.true_range = _RollingWindow(14)
+
+        self.macd_fast_ema = np.nan
+        self.macd_slow_ema = np.nan
+        self.macd_sig_ema = np.nan
+
+        self.prev_close = np.nan
+        self.prev_rsi = np.nan
+        self.prev_macd = np.nan
+        self.prev_macd_sig = np.nan
+        self.prev_hist = np.nan
+
 
 @register_strategy(
     "multi_indicator",
@@ -34,6 +247,11 @@ from ..registry import register_strategy
             "min_confirmations": {"type": "int", "default": 2, "min": 1, "max": 3},
             "stop_loss": {"type": "float", "default": 0.02, "min": 0.01, "max": 0.1},
             "take_profit": {"type": "float", "default": 0.04, "min": 0.02, "max": 0.2},
+            "dtype": {
+                "type": "str",
+                "default": "float64",
+                "choices": ["float64", "float32"],
+            },
         },
     },
 )
@@ -57,9 +275,12 @@ class MultiIndicatorStrategy(BaseStrategy):
     STRATEGY_NAME = "multi_indicator"
 
     def __init__(
-        self, name: str = "multi_indicator", params: Optional[Dict[str, Any]] = None
+        self,
+        name: str = "multi_indicator",
+        params: Optional[Dict[str, Any]] = None,
+        indicator_cache: Optional[IndicatorCache] = None,
     ):
-        super().__init__(name, params)
+        super().__init__(name, params, indicator_cache)
 
         # Default parameters
         self.rsi_period = self.get_parameter("rsi_period", 14)
@@ -79,15 +300,26 @@ class MultiIndicatorStrategy(BaseStrategy):
         self.stop_loss = self.get_parameter("stop_loss", 0.02)
         self.take_profit = self.get_parameter("take_profit", 0.04)
 
-    def compute_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        # Floating point precision of the signal computation
+        self.dtype = np.dtype(self.get_parameter("dtype", "float64"))
+
+        # Incremental indicator state for live streaming, see update()
+        self._stream: Optional[_StreamState] = None
+
+    def compute_signals(
+        self, data: pd.DataFrame, lean: bool = False
+    ) -> Union[pd.DataFrame, SignalResult]:
         """
         Compute trading signals based on multiple indicators.
 
         Args:
             data: DataFrame with OHLCV data
+            lean: Return only the signal, strength and ATR-based levels as
+                arrays, skipping the indicator columns and DataFrame
 
         Returns:
-            DataFrame with signals and all indicators
+            DataFrame with signals and all indicators, or a SignalResult
+            when lean is set
         """
         min_periods = (
             max(self.macd_slow, self.bb_period, self.rsi_period + 1) + self.macd_signal
@@ -95,193 +327,374 @@ class MultiIndicatorStrategy(BaseStrategy):
         if len(data) < min_periods:
             raise ValueError(f"Insufficient data: {len(data)} < {min_periods}")
 
-        # Make a copy to avoid modifying original data
-        df = data.copy()
-
         # Calculate all indicators
-        df = self._calculate_indicators(df)
-
-        # Generate individual indicator signals
-        df = self._generate_individual_signals(df)
+        out = self._calculate_indicators(data)
 
-        # Combine signals based on confirmations
-        df = self._combine_signals(df)
+        # Generate individual indicator signals and combine them
+        out = self._generate_signals(data, out, lean=lean)
 
         # Add risk management levels
-        df = self._add_risk_management(df)
+        out = self._add_risk_management(data, out, lean=lean)
 
-        return df
+        if lean:
+            return SignalResult(
+                out["signal"],
+                out["signal_strength"],
+                out["stop_loss_level"],
+                out["take_profit_level"],
+            )
 
-    def _calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self._append_columns(data, out)
+
+    def _calculate_indicators(self, data: pd.DataFrame) -> Dict[str, np.ndarray]:
         """Calculate all technical indicators."""
+        out: Dict[str, np.ndarray] = {}
+        close = data["close"]
 
         # RSI
-        df["rsi"] = TechnicalIndicators.rsi(df["close"], self.rsi_period)
+        out["rsi"] = self.indicator_cache.get_or_compute(
+            "rsi", TechnicalIndicators.rsi, (close,), (self.rsi_period,)
+        )
 
         # MACD
-        macd_line, signal_line, histogram = TechnicalIndicators.macd(
-            df["close"], self.macd_fast, self.macd_slow, self.macd_signal
+        out["macd"], out["macd_signal"], out["macd_histogram"] = (
+            self.indicator_cache.get_or_compute(
+                "macd",
+                TechnicalIndicators.macd,
+                (close,),
+                (self.macd_fast, self.macd_slow, self.macd_signal),
+            )
         )
-        df["macd"] = macd_line
-        df["macd_signal"] = signal_line
-        df["macd_histogram"] = histogram
 
         # Bollinger Bands
-        bb_upper, bb_middle, bb_lower = TechnicalIndicators.bollinger_bands(
-            df["close"], self.bb_period, self.bb_std
-        )
-        df["bb_upper"] = bb_upper
-        df["bb_middle"] = bb_middle
-        df["bb_lower"] = bb_lower
-        df["bb_position"] = (df["close"] - df["bb_lower"]) / (
-            df["bb_upper"] - df["bb_lower"]
+        out["bb_upper"], out["bb_middle"], out["bb_lower"] = (
+            self.indicator_cache.get_or_compute(
+                "bollinger_bands",
+                TechnicalIndicators.bollinger_bands,
+                (close,),
+                (self.bb_period, self.bb_std),
+            )
         )
+        # Position within the bands; a zero width maps to inf/NaN as a division would
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inv_width = np.reciprocal(out["bb_upper"] - out["bb_lower"])
+            out["bb_position"] = (close.to_numpy() - out["bb_lower"]) * inv_width
 
         # Volume analysis
-        df["volume_sma"] = df["volume"].rolling(window=20).mean()
-        df["volume_ratio"] = df["volume"] / df["volume_sma"]
+        volume = data["volume"]
+        volume_sma = volume.rolling(window=20).mean()
+        out["volume_sma"] = volume_sma.to_numpy()
+        out["volume_ratio"] = (volume / volume_sma).to_numpy()
 
         # Price momentum
-        df["price_change"] = df["close"].pct_change()
-        df["price_momentum"] = df["close"].pct_change(periods=5)
-
-        return df
+        close_np = close.to_numpy(dtype=np.float64)
+        out["price_change"] = self._pct_change(close_np)
+        out["price_momentum"] = self._pct_change(close_np, periods=5)
+
+        for key, values in out.items():
+            out[key] = values.astype(self.dtype, copy=False)
+
+        return out
+
+    def _signal_bits(
+        self, close: np.ndarray, out: Dict[str, np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Run the signal kernel: signal, strength and packed bull/bear flags."""
+        # Thresholds as typed scalars, so the kernel sees loop-invariant constants
+        scalar = self.dtype.type
+        return _compute_all_signals(
+            close,
+            out["rsi"],
+            out["macd"],
+            out["macd_signal"],
+            out["macd_histogram"],
+            out["bb_upper"],
+            out["bb_lower"],
+            out["volume_ratio"],
+            scalar(self.rsi_oversold),
+            scalar(self.rsi_overbought),
+            scalar(self.volume_threshold),
+            int(self.min_confirmations),
+        )
 
-    def _generate_individual_signals(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Generate signals from individual indicators."""
+    def _generate_signals(
+        self, data: pd.DataFrame, out: Dict[str, np.ndarray], lean: bool = False
+    ) -> Dict[str, np.ndarray]:
+        """Generate individual indicator signals and combine them."""
+        close = data["close"].to_numpy(dtype=self.dtype)
+        signal, strength, bull_bits, bear_bits = self._signal_bits(close, out)
+        if lean:
+            out["signal"] = signal
+            out["signal_strength"] = strength
+            return out
+
+        # Individual indicator signals, unpacked from the kernel's flag bits
+        for bit, name in enumerate(_SIGNAL_FLAGS):
+            out[f"{name}_bullish"] = ((bull_bits >> bit) & 1).astype(bool)
+            out[f"{name}_bearish"] = ((bear_bits >> bit) & 1).astype(bool)
 
-        # RSI signals
-        df["rsi_bullish"] = (df["rsi"] > self.rsi_oversold) & (
-            df["rsi"].shift(1) <= self.rsi_oversold
-        )
-        df["rsi_bearish"] = (df["rsi"] < self.rsi_overbought) & (
-            df["rsi"].shift(1) >= self.rsi_overbought
+        # Volume confirmation
+        out["volume_confirmation"] = out["volume_ratio"] > self.dtype.type(
+            self.volume_threshold
         )
 
-        # MACD signals
-        df["macd_bullish"] = (df["macd"] > df["macd_signal"]) & (
-            df["macd"].shift(1) <= df["macd_signal"].shift(1)
-        )
-        df["macd_bearish"] = (df["macd"] < df["macd_signal"]) & (
-            df["macd"].shift(1) >= df["macd_signal"].shift(1)
-        )
+        # Trend confirmation (simple)
+        out["trend_bullish"] = close > out["bb_middle"]
+        out["trend_bearish"] = close < out["bb_middle"]
+
+        # Confirmation counts and combined signal
+        out["bullish_count"] = _POPCOUNT_LUT[bull_bits]
+        out["bearish_count"] = _POPCOUNT_LUT[bear_bits]
+        out["signal"] = signal
+        out["signal_strength"] = strength
+
+        return out
+
+    def _add_risk_management(
+        self, data: pd.DataFrame, out: Dict[str, np.ndarray], lean: bool = False
+    ) -> Dict[str, np.ndarray]:
+        """Add risk management levels."""
 
-        # Additional MACD momentum check
-        df["macd_momentum_bullish"] = df["macd_histogram"] > df["macd_histogram"].shift(
-            1
+        # Dynamic stop loss based on ATR
+        atr = self.indicator_cache.get_or_compute(
+            "average_true_range",
+            TechnicalIndicators.average_true_range,
+            (data["high"], data["low"], data["close"]),
+            (14,),
+        ).astype(self.dtype, copy=False)
+        out["atr"] = atr
+
+        # Signal direction as a +1/-1 multiplier; levels only exist on signals
+        mask = out["signal"] != 0
+        sig = out["signal"].astype(self.dtype)
+        close = data["close"].to_numpy(dtype=self.dtype)
+
+        # Stop loss and take profit levels
+        out["stop_loss_level"] = np.where(mask, close - sig * atr * 2.0, np.nan)
+        out["take_profit_level"] = np.where(mask, close + sig * atr * 3.0, np.nan)
+        if lean:
+            return out
+
+        # Alternative fixed percentage levels
+        out["stop_loss_fixed"] = np.where(
+            mask, close * (1 - sig * self.stop_loss), np.nan
         )
-        df["macd_momentum_bearish"] = df["macd_histogram"] < df["macd_histogram"].shift(
-            1
+        out["take_profit_fixed"] = np.where(
+            mask, close * (1 + sig * self.take_profit), np.nan
         )
 
-        # Bollinger Bands signals
-        df["bb_bullish"] = (
-            df["close"] <= df["bb_lower"] * 1.001
-        ) & (  # Near or below lower band
-            df["rsi"] < 40
-        )  # RSI confirmation
-        df["bb_bearish"] = (
-            df["close"] >= df["bb_upper"] * 0.999
-        ) & (  # Near or above upper band
-            df["rsi"] > 60
-        )  # RSI confirmation
-
-        # Volume confirmation
-        df["volume_confirmation"] = df["volume_ratio"] > self.volume_threshold
+        return out
 
-        # Trend confirmation (simple)
-        df["trend_bullish"] = df["close"] > df["bb_middle"]
-        df["trend_bearish"] = df["close"] < df["bb_middle"]
+    def compute_signals_grid(
+        self, data: pd.DataFrame, param_grid: Mapping[str, Sequence[Any]]
+    ) -> pd.DataFrame:
+        """
+        Compute signals for every combination of threshold parameters at once.
 
-        return df
+        Indicators are computed once with this strategy's parameters and the
+        signal rules are evaluated for all K combinations by broadcasting,
+        which is much cheaper than running K separate strategies.
 
-    def _combine_signals(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Combine individual signals based on confirmation requirements."""
+        Args:
+            data: DataFrame with OHLCV data
+            param_grid: Mapping of parameter name to candidate values. Only
+                rsi_oversold, rsi_overbought, volume_threshold and
+                min_confirmations can be swept; parameters left out use this
+                strategy's values.
 
-        # Count bullish confirmations
-        bullish_signals = [
-            "rsi_bullish",
-            "macd_bullish",
-            "bb_bullish",
-            "macd_momentum_bullish",
-        ]
+        Returns:
+            DataFrame of int8 signals with one column per combination,
+            columns being a MultiIndex named after the grid parameters
 
-        # Count bearish confirmations
-        bearish_signals = [
-            "rsi_bearish",
-            "macd_bearish",
-            "bb_bearish",
-            "macd_momentum_bearish",
-        ]
+        Raises:
+            ValueError: If the grid is empty, a parameter cannot be swept or has
+                no values, or data is insufficient
+        """
+        if not param_grid:
+            raise ValueError("param_grid must name at least one parameter to sweep")
+        unsupported = set(param_grid) - set(_GRID_PARAMETERS)
+        if unsupported:
+            raise ValueError(
+                f"Parameters affecting indicators cannot be swept: {sorted(unsupported)}"
+            )
+        empty = [name for name, values in param_grid.items() if len(values) == 0]
+        if empty:
+            raise ValueError(f"No values given for grid parameters: {empty}")
 
-        # Count confirmations
-        df["bullish_count"] = df[bullish_signals].sum(axis=1)
-        df["bearish_count"] = df[bearish_signals].sum(axis=1)
+        min_periods = (
+            max(self.macd_slow, self.bb_period, self.rsi_period + 1) + self.macd_signal
+        )
+        if len(data) < min_periods:
+            raise ValueError(f"Insufficient data: {len(data)} < {min_periods}")
 
-        # Initialize signal column
-        df["signal"] = 0
+        names = list(param_grid)
+        combos = list(itertools.product(*(param_grid[name] for name in names)))
+        grid = {
+            name: np.array([getattr(self, name)] * len(combos))
+            for name in _GRID_PARAMETERS
+        }
+        for i, name in enumerate(names):
+            grid[name] = np.array([combo[i] for combo in combos])
+
+        out = self._calculate_indicators(data)
+        close = data["close"].to_numpy(dtype=self.dtype)
+        _, _, bull_bits, bear_bits = self._signal_bits(close, out)
+        scalar = self.dtype.type
+        rsi = out["rsi"][:, None]
+        prev_rsi = np.empty_like(rsi)
+        prev_rsi[0] = np.nan
+        prev_rsi[1:] = rsi[:-1]
+
+        # MACD, Bollinger and momentum flags are the same for every combination
+        fixed_bull = _POPCOUNT_LUT[bull_bits & _FIXED_FLAGS_MASK]
+        fixed_bear = _POPCOUNT_LUT[bear_bits & _FIXED_FLAGS_MASK]
+
+        # (N, K) confirmation counts with the RSI crossover per threshold
+        rsi_os = grid["rsi_oversold"].astype(self.dtype)[None, :]
+        rsi_ob = grid["rsi_overbought"].astype(self.dtype)[None, :]
+        bull_cnt = fixed_bull[:, None] + ((rsi > rsi_os) & (prev_rsi <= rsi_os))
+        bear_cnt = fixed_bear[:, None] + ((rsi < rsi_ob) & (prev_rsi >= rsi_ob))
+
+        volume_confirmation = (
+            out["volume_ratio"][:, None]
+            > grid["volume_threshold"].astype(self.dtype)[None, :]
+        )
+        min_conf = grid["min_confirmations"][None, :]
 
-        # Generate buy signals
         buy_condition = (
-            (df["bullish_count"] >= self.min_confirmations)
-            & (df["volume_confirmation"])
-            & (df["rsi"] < 80)  # Avoid buying in extreme overbought
+            (bull_cnt >= min_conf) & volume_confirmation & (rsi < scalar(80))
         )
-
-        # Generate sell signals
         sell_condition = (
-            (df["bearish_count"] >= self.min_confirmations)
-            & (df["volume_confirmation"])
-            & (df["rsi"] > 20)  # Avoid selling in extreme oversold
+            (bear_cnt >= min_conf) & volume_confirmation & (rsi > scalar(20))
         )
 
-        df.loc[buy_condition, "signal"] = 1
-        df.loc[sell_condition, "signal"] = -1
+        signals = np.zeros(buy_condition.shape, dtype=np.int8)
+        signals[buy_condition] = 1
+        signals[sell_condition] = -1
 
-        # Signal strength based on number of confirmations
-        df["signal_strength"] = np.where(
-            df["signal"] == 1,
-            df["bullish_count"],
-            np.where(df["signal"] == -1, df["bearish_count"], 0),
-        )
+        columns = pd.MultiIndex.from_tuples(combos, names=names)
+        return pd.DataFrame(signals, index=data.index, columns=columns)
 
-        return df
+    def update(self, bar: Mapping[str, float]) -> Dict[str, Any]:
+        """
+        Process a single new bar in live streaming mode.
 
-    def _add_risk_management(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Add risk management levels."""
+        Indicator state is carried over between calls, so each bar costs O(1)
+        instead of recomputing every indicator over the full history. Feeding
+        the bars of a DataFrame one by one yields the same signals as
+        ``compute_signals`` on that DataFrame.
 
-        # Dynamic stop loss based on ATR
-        atr = TechnicalIndicators.average_true_range(df["high"], df["low"], df["close"])
-        df["atr"] = atr
-
-        # Stop loss levels
-        df["stop_loss_level"] = np.where(
-            df["signal"] == 1,
-            df["close"] - (df["atr"] * 2),
-            np.where(df["signal"] == -1, df["close"] + (df["atr"] * 2), np.nan),
-        )
+        Args:
+            bar: Mapping with high, low, close and volume values
 
-        # Take profit levels
-        df["take_profit_level"] = np.where(
-            df["signal"] == 1,
-            df["close"] + (df["atr"] * 3),
-            np.where(df["signal"] == -1, df["close"] - (df["atr"] * 3), np.nan),
-        )
+        Returns:
+            Dictionary with the bar's indicators, signal and risk levels
+        """
+        if self._stream is None:
+            self._stream = _StreamState(self)
+        state = self._stream
+
+        close = float(bar["close"])
+        high = float(bar["high"])
+        low = float(bar["low"])
+        volume = float(bar["volume"])
+        prev_close = state.prev_close
+
+        # RSI from rolling average gains/losses
+        delta = close - prev_close
+        state.rsi_gain.push(delta if delta > 0 else 0.0)
+        state.rsi_loss.push(-delta if delta < 0 else 0.0)
+        avg_gain = state.rsi_gain.mean()
+        avg_loss = state.rsi_loss.mean()
+        if avg_loss != 0:
+            rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        else:
+            rsi = 100.0 if avg_gain > 0 else np.nan
+
+        # MACD from exponential moving averages
+        if state.prev_close != state.prev_close:  # First bar seeds the EMAs
+            state.macd_fast_ema = state.macd_slow_ema = close
+        else:
+            state.macd_fast_ema += state.alpha_fast * (close - state.macd_fast_ema)
+            state.macd_slow_ema += state.alpha_slow * (close - state.macd_slow_ema)
+        macd = state.macd_fast_ema - state.macd_slow_ema
+        if state.macd_sig_ema != state.macd_sig_ema:
+            state.macd_sig_ema = macd
+        else:
+            state.macd_sig_ema += state.alpha_signal * (macd - state.macd_sig_ema)
+        macd_sig = state.macd_sig_ema
+        hist = macd - macd_sig
 
-        # Alternative fixed percentage levels
-        df["stop_loss_fixed"] = np.where(
-            df["signal"] == 1,
-            df["close"] * (1 - self.stop_loss),
-            np.where(df["signal"] == -1, df["close"] * (1 + self.stop_loss), np.nan),
-        )
+        # Bollinger Bands
+        state.bb.push(close)
+        bb_middle = state.bb.mean()
+        band = state.bb.std() * self.bb_std
+        bb_upper = bb_middle + band
+        bb_lower = bb_middle - band
 
-        df["take_profit_fixed"] = np.where(
-            df["signal"] == 1,
-            df["close"] * (1 + self.take_profit),
-            np.where(df["signal"] == -1, df["close"] * (1 - self.take_profit), np.nan),
+        # Volume analysis
+        state.volume.push(volume)
+        volume_ratio = volume / state.volume.mean()
+
+        # Average True Range
+        true_range = high - low
+        if prev_close == prev_close:
+            true_range = max(true_range, abs(high - prev_close), abs(low - prev_close))
+        state.true_range.push(true_range)
+        atr = state.true_range.mean()
+
+        signal, strength, bull_bits, bear_bits = _bar_signal(
+            close,
+            rsi,
+            state.prev_rsi,
+            macd,
+            state.prev_macd,
+            macd_sig,
+            state.prev_macd_sig,
+            hist,
+            state.prev_hist,
+            bb_upper,
+            bb_lower,
+            volume_ratio,
+            float(self.rsi_oversold),
+            float(self.rsi_overbought),
+            float(self.volume_threshold),
+            int(self.min_confirmations),
         )
 
-        return df
+        state.prev_close = close
+        state.prev_rsi = rsi
+        state.prev_macd = macd
+        state.prev_macd_sig = macd_sig
+        state.prev_hist = hist
+
+        result = {
+            "rsi": rsi,
+            "macd": macd,
+            "macd_signal": macd_sig,
+            "macd_histogram": hist,
+            "bb_upper": bb_upper,
+            "bb_middle": bb_middle,
+            "bb_lower": bb_lower,
+            "volume_ratio": volume_ratio,
+            "atr": atr,
+            "bullish_count": int(_POPCOUNT_LUT[bull_bits]),
+            "bearish_count": int(_POPCOUNT_LUT[bear_bits]),
+            "signal": signal,
+            "signal_strength": strength,
+            "stop_loss_level": np.nan,
+            "take_profit_level": np.nan,
+        }
+        if signal != 0:
+            result["stop_loss_level"] = close - signal * atr * 2.0
+            result["take_profit_level"] = close + signal * atr * 3.0
+
+        self._last_signal = signal
+        return result
+
+    def reset_stream(self) -> None:
+        """Discard the streaming state accumulated by ``update``."""
+        self._stream = None
 
     def get_required_indicators(self) -> List[str]:
         """Get list of required indicators."""
@@ -339,6 +752,9 @@ class MultiIndicatorStrategy(BaseStrategy):
             if not (0 < self.take_profit < 1):
                 return False, "Take profit must be between 0 and 1"
 
+            if self.dtype not in (np.float32, np.float64):
+                return False, "Precision must be float32 or float64"
+
             return True, None
 
         except Exception as e:
@@ -2,15 +2,86 @@
 RSI Reversal Strategy implementation.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from numba import njit
 
-from ..base_strategy import BaseStrategy
-from ..indicators import TechnicalIndicators
+from ..base_strategy import BaseStrategy, SignalResult
+from ..indicators import IndicatorCache, TechnicalIndicators
 from ..registry import register_strategy
 
+# Look-back of the price/RSI momentum used for divergence detection
+_MOMENTUM_PERIOD = 5
+
+
+@njit(cache=True, error_model="numpy")
+def _rsi_reversal_kernel(
+    close, rsi, oversold, overbought, sl_down, sl_up, tp_down, tp_up
+):
+    """
+    Compute signals, zones, divergences and risk levels in a single pass.
+
+    Level factors are ``1 -/+ stop_loss`` and ``1 -/+ take_profit`` in the
+    dtype of ``close``, so float32 inputs stay float32 throughout.
+
+    Returns:
+        Tuple of (signal, zone, price momentum, RSI momentum, divergence,
+        stop loss level, take profit level) arrays
+    """
+    n = close.shape[0]
+    p = _MOMENTUM_PERIOD
+    signal = np.zeros(n, dtype=np.int8)
+    zone = np.zeros(n, dtype=np.int8)
+    divergence = np.zeros(n, dtype=np.int8)
+    price_momentum = np.full(n, np.nan, dtype=close.dtype)
+    rsi_momentum = np.full(n, np.nan, dtype=rsi.dtype)
+    stop_loss_level = np.full(n, np.nan, dtype=close.dtype)
+    take_profit_level = np.full(n, np.nan, dtype=close.dtype)
+
+    prev = np.nan
+    for i in range(n):
+        curr = rsi[i]
+
+        # Buy on a cross above oversold, sell on a cross below overbought
+        if curr < overbought and prev >= overbought:
+            signal[i] = -1
+            stop_loss_level[i] = close[i] * sl_up
+            take_profit_level[i] = close[i] * tp_down
+        elif curr > oversold and prev <= oversold:
+            signal[i] = 1
+            stop_loss_level[i] = close[i] * sl_down
+            take_profit_level[i] = close[i] * tp_up
+        prev = curr
+
+        # -1 oversold, 0 neutral, 1 overbought
+        if curr >= overbought:
+            zone[i] = 1
+        elif curr <= oversold:
+            zone[i] = -1
+
+        # -1 bearish, 0 none, 1 bullish divergence of price and RSI momentum
+        if i >= p:
+            pm = close[i] / close[i - p] - 1.0
+            rm = curr - rsi[i - p]
+            price_momentum[i] = pm
+            rsi_momentum[i] = rm
+            if pm < 0 and rm > 0 and curr < 40:
+                divergence[i] = 1
+            elif pm > 0 and rm < 0 and curr > 60:
+                divergence[i] = -1
+
+    return (
+        signal,
+        zone,
+        price_momentum,
+        rsi_momentum,
+        divergence,
+        stop_loss_level,
+        take_profit_level,
+    )
+
 
 @register_strategy(
     "rsi_reversal",
@@ -32,6 +103,11 @@ from ..registry import register_strategy
             },
             "stop_loss": {"type": "float", "default": 0.03, "min": 0.01, "max": 0.1},
             "take_profit": {"type": "float", "default": 0.06, "min": 0.02, "max": 0.2},
+            "dtype": {
+                "type": "str",
+                "default": "float64",
+                "choices": ["float64", "float32"],
+            },
         },
     },
 )
@@ -49,10 +125,17 @@ class RSIReversalStrategy(BaseStrategy):
 
     STRATEGY_NAME = "rsi_reversal"
 
+    # Categories of the rsi_zone and divergence columns, indexed by code + 1
+    RSI_ZONES = ["oversold", "neutral", "overbought"]
+    DIVERGENCES = ["bearish", "none", "bullish"]
+
     def __init__(
-        self, name: str = "rsi_reversal", params: Optional[Dict[str, Any]] = None
+        self,
+        name: str = "rsi_reversal",
+        params: Optional[Dict[str, Any]] = None,
+        indicator_cache: Optional[IndicatorCache] = None,
     ):
-        super().__init__(name, params)
+        super().__init__(name, params, indicator_cache)
 
         # Default parameters
         self.rsi_period = self.get_parameter("rsi_period", 14)
@@ -61,89 +144,80 @@ class RSIReversalStrategy(BaseStrategy):
         self.stop_loss = self.get_parameter("stop_loss", 0.03)
         self.take_profit = self.get_parameter("take_profit", 0.06)
 
-        # Validate parameters
+        # Floating point precision of the signal computation
+        self.dtype = np.dtype(self.get_parameter("dtype", "float64"))
+
+        # Thresholds that cannot produce a signal are rejected up front; the
+        # remaining range checks are left to validate_parameters
         if self.oversold_threshold >= self.overbought_threshold:
             raise ValueError(
                 "Oversold threshold must be less than overbought threshold"
             )
 
-    def compute_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+    def compute_signals(
+        self, data: pd.DataFrame, lean: bool = False
+    ) -> Union[pd.DataFrame, SignalResult]:
         """
         Compute trading signals based on RSI levels.
 
         Args:
             data: DataFrame with OHLCV data
+            lean: Return only the signal and risk levels as arrays, skipping
+                the zone/divergence columns and DataFrame
 
         Returns:
-            DataFrame with signals and RSI indicator
+            DataFrame with signals and RSI indicator, or a SignalResult when
+            lean is set
         """
         if len(data) < self.rsi_period + 1:
             raise ValueError(f"Insufficient data: {len(data)} < {self.rsi_period + 1}")
 
-        # Make a copy to avoid modifying original data
-        df = data.copy()
+        # Parameters read once, as typed scalars for the kernel
+        scalar = self.dtype.type
+        close = data["close"]
 
         # Calculate RSI
-        df["rsi"] = TechnicalIndicators.rsi(df["close"], self.rsi_period)
-
-        # Initialize signal column
-        df["signal"] = 0
-
-        # Generate signals based on RSI thresholds
-        # Buy signal: RSI crosses above oversold threshold (bullish reversal)
-        buy_condition = (df["rsi"] > self.oversold_threshold) & (
-            df["rsi"].shift(1) <= self.oversold_threshold
-        )
-
-        # Sell signal: RSI crosses below overbought threshold (bearish reversal)
-        sell_condition = (df["rsi"] < self.overbought_threshold) & (
-            df["rsi"].shift(1) >= self.overbought_threshold
-        )
-
-        df.loc[buy_condition, "signal"] = 1
-        df.loc[sell_condition, "signal"] = -1
-
-        # Add RSI zones for analysis
-        df["rsi_zone"] = np.where(
-            df["rsi"] <= self.oversold_threshold,
-            "oversold",
-            np.where(df["rsi"] >= self.overbought_threshold, "overbought", "neutral"),
-        )
-
-        # Add divergence detection (simple version)
-        df["price_momentum"] = df["close"].pct_change(periods=5)
-        df["rsi_momentum"] = df["rsi"].diff(periods=5)
-
-        # Bullish divergence: price making lower lows, RSI making higher lows
-        bullish_divergence = (
-            (df["price_momentum"] < 0) & (df["rsi_momentum"] > 0) & (df["rsi"] < 40)
-        )
-
-        # Bearish divergence: price making higher highs, RSI making lower highs
-        bearish_divergence = (
-            (df["price_momentum"] > 0) & (df["rsi_momentum"] < 0) & (df["rsi"] > 60)
-        )
-
-        df["divergence"] = np.where(
-            bullish_divergence,
-            "bullish",
-            np.where(bearish_divergence, "bearish", "none"),
+        rsi = self.indicator_cache.get_or_compute(
+            "rsi", TechnicalIndicators.rsi, (close,), (self.rsi_period,)
+        ).astype(self.dtype, copy=False)
+
+        (
+            signal,
+            zone,
+            price_momentum,
+            rsi_momentum,
+            divergence,
+            stop_loss_level,
+            take_profit_level,
+        ) = _rsi_reversal_kernel(
+            close.to_numpy(dtype=self.dtype),
+            rsi,
+            scalar(self.oversold_threshold),
+            scalar(self.overbought_threshold),
+            scalar(1 - self.stop_loss),
+            scalar(1 + self.stop_loss),
+            scalar(1 - self.take_profit),
+            scalar(1 + self.take_profit),
         )
+        if lean:
+            # A single-indicator signal has no graded strength
+            return SignalResult(
+                signal, np.abs(signal), stop_loss_level, take_profit_level
+            )
 
-        # Add entry/exit levels for risk management
-        df["stop_loss_level"] = np.where(
-            df["signal"] == 1,
-            df["close"] * (1 - self.stop_loss),
-            np.where(df["signal"] == -1, df["close"] * (1 + self.stop_loss), np.nan),
-        )
+        # The input is only read from; computed columns go to a new frame
+        out: Dict[str, Any] = {
+            "rsi": rsi,
+            "signal": signal,
+            "rsi_zone": pd.Categorical.from_codes(zone + 1, self.RSI_ZONES),
+            "price_momentum": price_momentum,
+            "rsi_momentum": rsi_momentum,
+            "divergence": pd.Categorical.from_codes(divergence + 1, self.DIVERGENCES),
+            "stop_loss_level": stop_loss_level,
+            "take_profit_level": take_profit_level,
+        }
 
-        df["take_profit_level"] = np.where(
-            df["signal"] == 1,
-            df["close"] * (1 + self.take_profit),
-            np.where(df["signal"] == -1, df["close"] * (1 - self.take_profit), np.nan),
-        )
-
-        return df
+        return self._append_columns(data, out)
 
     def get_required_indicators(self) -> List[str]:
         """Get list of required indicators."""
@@ -161,18 +235,15 @@ class RSIReversalStrategy(BaseStrategy):
             if not (50 < self.overbought_threshold < 100):
                 return False, "Overbought threshold must be between 50 and 100"
 
-            if self.oversold_threshold >= self.overbought_threshold:
-                return (
-                    False,
-                    "Oversold threshold must be less than overbought threshold",
-                )
-
             if not (0 < self.stop_loss < 1):
                 return False, "Stop loss must be between 0 and 1"
 
             if not (0 < self.take_profit < 1):
                 return False, "Take profit must be between 0 and 1"
 
+            if self.dtype not in (np.float32, np.float64):
+                return False, "Precision must be float32 or float64"
+
             return True, None
 
         except Exception as e:
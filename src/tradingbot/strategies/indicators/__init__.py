@@ -2,6 +2,7 @@
 Technical indicators package for the Crypto Trading Bot.
 """
 
+from .cache import IndicatorCache
 from .technical_indicators import TechnicalIndicators
 
-__all__ = ["TechnicalIndicators"]
+__all__ = ["IndicatorCache", "TechnicalIndicators"]
@@ -0,0 +1,700 @@
+"""
+Numba kernels behind TechnicalIndicators.
+
+The rolling primitives reproduce pandas' window algorithms (compensated
+add/remove updates, NaN handling and ``min_periods`` equal to the window), so
+indicators computed here are bit-identical to their pandas equivalents.
+Kernels accept float64 or float32 arrays and return arrays of the input dtype,
+while running sums, means and variances are always accumulated in float64.
+The public kernels release the GIL, so several series can be processed on
+concurrent threads. Wrapping in Series is left to the callers.
+"""
+
+import math
+
+import numpy as np
+from numba import njit
+
+# Layout of the running state of a rolling mean or sum. The updates follow
+# pandas' compensated (Kahan) add/remove scheme
+_NOBS, _SUM, _NEG_CT, _COMP_ADD, _COMP_REMOVE, _SAME_CT, _PREV = range(7)
+
+# Layout of the running state of a rolling variance, following pandas'
+# Welford updates with Kahan compensation; the run-length slots (_SAME_CT,
+# _PREV) are shared with the mean state layout
+_VAR_NOBS, _VAR_MEAN, _VAR_SSQDM, _VAR_COMP_ADD, _VAR_COMP_REMOVE = range(5)
+
+
+@njit(cache=True)
+def _state_reset(state, first):
+    """Start a new window whose first value is ``first``."""
+    state[:] = 0.0
+    state[_PREV] = first
+
+
+@njit(cache=True)
+def _mean_add(state, val):
+    """Add a value entering the window."""
+    if val == val:
+        state[_NOBS] += 1
+        y = val - state[_COMP_ADD]
+        t = state[_SUM] + y
+        state[_COMP_ADD] = t - state[_SUM] - y
+        state[_SUM] = t
+        if math.copysign(1.0, val) < 0:
+            state[_NEG_CT] += 1
+        # Runs of identical values return the value itself, without artifacts
+        if val == state[_PREV]:
+            state[_SAME_CT] += 1
+        else:
+            state[_SAME_CT] = 1
+        state[_PREV] = val
+
+
+@njit(cache=True)
+def _mean_remove(state, val):
+    """Remove a value leaving the window."""
+    if val == val:
+        state[_NOBS] -= 1
+        y = -val - state[_COMP_REMOVE]
+        t = state[_SUM] + y
+        state[_COMP_REMOVE] = t - state[_SUM] - y
+        state[_SUM] = t
+        if math.copysign(1.0, val) < 0:
+            state[_NEG_CT] -= 1
+
+
+@njit(cache=True)
+def _mean_value(state, min_periods):
+    """Current window mean, NaN with fewer than ``min_periods`` observations."""
+    nobs = state[_NOBS]
+    if nobs < min_periods or nobs == 0:
+        return np.nan
+    if state[_SAME_CT] >= nobs:
+        return state[_PREV]
+    result = state[_SUM] / nobs
+    if state[_NEG_CT] == 0 and result < 0:
+        return 0.0
+    if state[_NEG_CT] == nobs and result > 0:
+        return 0.0
+    return result
+
+
+@njit(cache=True)
+def _sum_value(state, min_periods):
+    """Current window sum, NaN with fewer than ``min_periods`` observations."""
+    nobs = state[_NOBS]
+    if nobs < min_periods:
+        return np.nan
+    if nobs == 0:
+        return 0.0
+    if state[_SAME_CT] >= nobs:
+        return state[_PREV] * nobs
+    return state[_SUM]
+
+
+@njit(cache=True)
+def _var_add(state, val):
+    """Add a value entering the window."""
+    if val != val:
+        return
+    state[_VAR_NOBS] += 1
+    if val == state[_PREV]:
+        state[_SAME_CT] += 1
+    else:
+        state[_SAME_CT] = 1
+    state[_PREV] = val
+
+    prev_mean = state[_VAR_MEAN] - state[_VAR_COMP_ADD]
+    y = val - state[_VAR_COMP_ADD]
+    t = y - state[_VAR_MEAN]
+    state[_VAR_COMP_ADD] = t + state[_VAR_MEAN] - y
+    state[_VAR_MEAN] = state[_VAR_MEAN] + t / state[_VAR_NOBS]
+    state[_VAR_SSQDM] += (val - prev_mean) * (val - state[_VAR_MEAN])
+
+
+@njit(cache=True)
+def _var_remove(state, val):
+    """Remove a value leaving the window."""
+    if val != val:
+        return
+    state[_VAR_NOBS] -= 1
+    if state[_VAR_NOBS]:
+        prev_mean = state[_VAR_MEAN] - state[_VAR_COMP_REMOVE]
+        y = val - state[_VAR_COMP_REMOVE]
+        t = y - state[_VAR_MEAN]
+        state[_VAR_COMP_REMOVE] = t + state[_VAR_MEAN] - y
+        state[_VAR_MEAN] = state[_VAR_MEAN] - t / state[_VAR_NOBS]
+        state[_VAR_SSQDM] -= (val - prev_mean) * (val - state[_VAR_MEAN])
+    else:
+        state[_VAR_MEAN] = 0.0
+        state[_VAR_SSQDM] = 0.0
+
+
+@njit(cache=True)
+def _std_value(state, min_periods):
+    """Current sample standard deviation (ddof=1), NaN below ``min_periods``."""
+    nobs = state[_VAR_NOBS]
+    if nobs < min_periods or nobs <= 1:
+        return np.nan
+    if state[_SAME_CT] >= nobs:
+        return 0.0
+    var = state[_VAR_SSQDM] / (nobs - 1)
+    return math.sqrt(var) if var > 0 else 0.0
+
+
+@njit(cache=True)
+def _deque_new(window):
+    """
+    Monotonic deque for a window: a ring buffer of indices whose capacity is a
+    power of two (so positions wrap with a mask), plus [head, tail] counters.
+    """
+    capacity = 1
+    while capacity < window:
+        capacity *= 2
+    return np.empty(capacity, dtype=np.int64), np.zeros(2, dtype=np.int64)
+
+
+@njit(cache=True)
+def _deque_push(deque, bounds, values, i, window, sign):
+    """
+    Slide the deque to include ``values[i]``; its head is then the index of
+    the window maximum (``sign`` = 1) or minimum (``sign`` = -1). NaN values
+    are skipped.
+    """
+    mask = deque.shape[0] - 1
+    while bounds[1] > bounds[0] and deque[bounds[0] & mask] <= i - window:
+        bounds[0] += 1
+    val = sign * values[i]
+    if val != val:
+        return
+    while bounds[1] > bounds[0] and sign * values[deque[(bounds[1] - 1) & mask]] <= val:
+        bounds[1] -= 1
+    deque[bounds[1] & mask] = i
+    bounds[1] += 1
+
+
+@njit(cache=True)
+def _deque_head(deque, bounds):
+    """Index of the current window extremum."""
+    return deque[bounds[0] & (deque.shape[0] - 1)]
+
+
+@njit(cache=True)
+def _pairwise_block(values, start, count):
+    """Sum up to 128 values with numpy's eight-accumulator unrolled loop."""
+    if count < 8:
+        total = -0.0
+        for i in range(start, start + count):
+            total += values[i]
+        return total
+    # Accumulators are float64 whatever the input dtype
+    r0 = np.float64(values[start])
+    r1 = np.float64(values[start + 1])
+    r2 = np.float64(values[start + 2])
+    r3 = np.float64(values[start + 3])
+    r4 = np.float64(values[start + 4])
+    r5 = np.float64(values[start + 5])
+    r6 = np.float64(values[start + 6])
+    r7 = np.float64(values[start + 7])
+    i = start + 8
+    stop = start + count - count % 8
+    while i < stop:
+        r0 += values[i]
+        r1 += values[i + 1]
+        r2 += values[i + 2]
+        r3 += values[i + 3]
+        r4 += values[i + 4]
+        r5 += values[i + 5]
+        r6 += values[i + 6]
+        r7 += values[i + 7]
+        i += 8
+    total = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7))
+    while i < start + count:
+        total += values[i]
+        i += 1
+    return total
+
+
+@njit(cache=True)
+def _pairwise_tree(values, start, count):
+    """
+    Pairwise sum of one buffer: blocks larger than 128 values are split in
+    halves. The recursion is unrolled onto an explicit stack because cached
+    recursive kernels are not reliable in Numba.
+    """
+    if count <= 128:
+        return _pairwise_block(values, start, count)
+
+    # Frames of (start, count, stage, left half sum); a buffer needs at most 8 levels
+    starts = np.empty(16, dtype=np.int64)
+    counts = np.empty(16, dtype=np.int64)
+    stages = np.zeros(16, dtype=np.int64)
+    lefts = np.empty(16)
+    starts[0], counts[0] = start, count
+    top = 0
+    result = 0.0
+    while top >= 0:
+        if counts[top] <= 128:
+            result = _pairwise_block(values, starts[top], counts[top])
+            top -= 1
+            continue
+
+        half = counts[top] // 2
+        half -= half % 8
+        if stages[top] == 0:
+            stages[top] = 1
+            child_start, child_count = starts[top], half
+        elif stages[top] == 1:
+            stages[top] = 2
+            lefts[top] = result
+            child_start, child_count = starts[top] + half, counts[top] - half
+        else:
+            result = lefts[top] + result
+            top -= 1
+            continue
+
+        top += 1
+        starts[top], counts[top], stages[top] = child_start, child_count, 0
+
+    return result
+
+
+@njit(cache=True)
+def pairwise_sum(values, start, count):
+    """
+    Sum ``values[start:start + count]`` in the same order as ``np.sum``.
+
+    Like numpy's add reduction, the values are summed pairwise in buffers of
+    8192, which are then accumulated sequentially.
+    """
+    total = _pairwise_tree(values, start, min(count, 8192))
+    for chunk in range(start + 8192, start + count, 8192):
+        total += _pairwise_tree(values, chunk, min(8192, start + count - chunk))
+    return total
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean(values, window):
+    """Rolling mean, NaN until ``window`` observations are in the window."""
+    n = values.shape[0]
+    out = np.empty(n, dtype=values.dtype)
+    state = np.empty(7)
+    for i in range(n):
+        if i == 0 or window == 1:
+            _state_reset(state, values[i])
+        elif i >= window:
+            _mean_remove(state, values[i - window])
+        _mean_add(state, values[i])
+        out[i] = _mean_value(state, window)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rolling_sum(values, window):
+    """Rolling sum, NaN until ``window`` observations are in the window."""
+    n = values.shape[0]
+    out = np.empty(n, dtype=values.dtype)
+    state = np.empty(7)
+    for i in range(n):
+        if i == 0 or window == 1:
+            _state_reset(state, values[i])
+        elif i >= window:
+            _mean_remove(state, values[i - window])
+        _mean_add(state, values[i])
+        out[i] = _sum_value(state, window)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rolling_std(values, window):
+    """Rolling sample standard deviation, NaN until the window is full."""
+    n = values.shape[0]
+    out = np.empty(n, dtype=values.dtype)
+    state = np.empty(7)
+    for i in range(n):
+        if i == 0 or window == 1:
+            _state_reset(state, values[i])
+        elif i >= window:
+            _var_remove(state, values[i - window])
+        _var_add(state, values[i])
+        out[i] = _std_value(state, window)
+    return out
+
+
+@njit(cache=True)
+def _rolling_extremum(values, window, sign):
+    """Rolling maximum (``sign`` = 1) or minimum (``sign`` = -1)."""
+    n = values.shape[0]
+    out = np.empty(n, dtype=values.dtype)
+    deque, bounds = _deque_new(window)
+    missing = 0
+    for i in range(n):
+        _deque_push(deque, bounds, values, i, window, sign)
+        missing += values[i] != values[i]
+        if i >= window:
+            missing -= values[i - window] != values[i - window]
+        if i < window - 1 or missing:
+            out[i] = np.nan
+        else:
+            out[i] = values[_deque_head(deque, bounds)]
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rolling_max(values, window):
+    """Rolling maximum in O(n), NaN if the window is not full of values."""
+    return _rolling_extremum(values, window, 1.0)
+
+
+@njit(cache=True, nogil=True)
+def rolling_min(values, window):
+    """Rolling minimum in O(n), NaN if the window is not full of values."""
+    return _rolling_extremum(values, window, -1.0)
+
+
+@njit(cache=True)
+def _ewm_alpha(alpha):
+    """Smoothing factor after pandas' round-trip through the center of mass."""
+    com = (1 - alpha) / alpha
+    return 1.0 / (1.0 + com)
+
+
+@njit(cache=True)
+def _ewm_update(weighted, old_wt, cur, alpha):
+    """
+    Advance an ``adjust=False`` exponentially weighted mean by one value.
+
+    Returns:
+        Tuple of the new (weighted mean, weight of the previous mean)
+    """
+    if weighted == weighted:
+        old_wt *= 1.0 - alpha
+        if cur == cur:
+            # Avoid numerical errors on constant series
+            if weighted != cur:
+                weighted = old_wt * weighted + alpha * cur
+                weighted /= old_wt + alpha
+            old_wt = 1.0
+    elif cur == cur:
+        weighted = cur
+    return weighted, old_wt
+
+
+@njit(cache=True, nogil=True)
+def ewm_mean(values, alpha):
+    """
+    Exponentially weighted mean with ``adjust=False``.
+
+    The weights are normalized exactly as pandas does, including the
+    round-trip of ``alpha`` through the center of mass.
+    """
+    alpha = _ewm_alpha(alpha)
+    n = values.shape[0]
+    out = np.empty(n, dtype=values.dtype)
+    weighted, old_wt = np.nan, 1.0
+    for i in range(n):
+        weighted, old_wt = _ewm_update(weighted, old_wt, values[i], alpha)
+        out[i] = weighted
+    return out
+
+
+@njit(cache=True, nogil=True)
+def macd(values, fast, slow, signal):
+    """
+    MACD line, signal line and histogram in a single pass, advancing the
+    fast, slow and signal EMAs together.
+
+    Returns:
+        Tuple of (MACD line, signal line, histogram) arrays
+    """
+    alpha_fast = _ewm_alpha(2.0 / (fast + 1))
+    alpha_slow = _ewm_alpha(2.0 / (slow + 1))
+    alpha_signal = _ewm_alpha(2.0 / (signal + 1))
+
+    n = values.shape[0]
+    macd_line = np.empty(n, dtype=values.dtype)
+    signal_line = np.empty(n, dtype=values.dtype)
+    histogram = np.empty(n, dtype=values.dtype)
+    ema_fast = ema_slow = ema_signal = np.nan
+    wt_fast = wt_slow = wt_signal = 1.0
+    for i in range(n):
+        ema_fast, wt_fast = _ewm_update(ema_fast, wt_fast, values[i], alpha_fast)
+        ema_slow, wt_slow = _ewm_update(ema_slow, wt_slow, values[i], alpha_slow)
+        line = ema_fast - ema_slow
+        ema_signal, wt_signal = _ewm_update(ema_signal, wt_signal, line, alpha_signal)
+        macd_line[i] = line
+        signal_line[i] = ema_signal
+        histogram[i] = line - ema_signal
+
+    return macd_line, signal_line, histogram
+
+
+@njit(cache=True, nogil=True)
+def on_balance_volume(close, volume):
+    """
+    Running sum of volume signed by the close-to-close direction.
+
+    Bars where the close did not move (or is NaN) add nothing, and NaN
+    volumes yield NaN without breaking the running sum, as with
+    ``Series.cumsum``.
+    """
+    n = close.shape[0]
+    out = np.empty(n, dtype=volume.dtype)
+    total = 0.0
+    for i in range(n):
+        direction = 0
+        if i > 0:
+            direction = (close[i] > close[i - 1]) - (close[i] < close[i - 1])
+        flow = direction * volume[i]
+        if flow == flow:
+            total += flow
+            out[i] = total
+        else:
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True, nogil=True, error_model="numpy")
+def cumulative_vwap(high, low, close, volume):
+    """
+    Cumulative VWAP, accumulating price-volume and volume in one pass.
+
+    NaN prices or volumes yield NaN without breaking the running sums, as
+    with ``Series.cumsum``.
+    """
+    n = close.shape[0]
+    out = np.empty(n, dtype=close.dtype)
+    total_pv = 0.0
+    total_volume = 0.0
+    for i in range(n):
+        pv = (np.float64(high[i]) + low[i] + close[i]) / 3 * volume[i]
+        if pv == pv:
+            total_pv += pv
+        if volume[i] == volume[i]:
+            total_volume += volume[i]
+        if pv == pv and volume[i] == volume[i]:
+            out[i] = total_pv / total_volume
+        else:
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean_deviation(values, window):
+    """
+    Rolling mean absolute deviation around the window mean.
+
+    Windows containing NaN yield NaN, as with ``rolling(window).apply``.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan, dtype=values.dtype)
+    deviations = np.empty(window)
+    valid = 0
+    for i in range(n):
+        # Count of consecutive non-NaN values ending at i
+        valid = valid + 1 if values[i] == values[i] else 0
+        if valid < window:
+            continue
+
+        start = i - window + 1
+        mean = pairwise_sum(values, start, window) / window
+        for j in range(window):
+            deviations[j] = abs(values[start + j] - mean)
+        out[i] = pairwise_sum(deviations, 0, window) / window
+
+    return out
+
+
+@njit(cache=True, nogil=True, error_model="numpy")
+def rsi(prices, window):
+    """
+    RSI from rolling means of gains and losses in a single pass.
+
+    Gains and losses are computed on the fly; the first delta (and any delta
+    involving NaN) counts as no change, as with ``Series.where``.
+    """
+    n = prices.shape[0]
+    out = np.empty(n, dtype=prices.dtype)
+    # Ring buffers of the gains/losses currently in the window
+    gains = np.empty(window)
+    losses = np.empty(window)
+    gain_state = np.empty(7)
+    loss_state = np.empty(7)
+
+    slot = 0
+    for i in range(n):
+        delta = np.float64(prices[i]) - prices[i - 1] if i > 0 else np.nan
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else -0.0
+
+        if i == 0 or window == 1:
+            _state_reset(gain_state, gain)
+            _state_reset(loss_state, loss)
+        elif i >= window:
+            _mean_remove(gain_state, gains[slot])
+            _mean_remove(loss_state, losses[slot])
+        gains[slot] = gain
+        losses[slot] = loss
+        _mean_add(gain_state, gain)
+        _mean_add(loss_state, loss)
+        slot = slot + 1 if slot + 1 < window else 0
+
+        avg_gain = _mean_value(gain_state, window)
+        avg_loss = _mean_value(loss_state, window)
+        if avg_loss == 0:
+            # No losses: 100 on any gain, undefined for a flat window
+            out[i] = 100.0 if avg_gain > 0 else np.nan
+        else:
+            out[i] = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    return out
+
+
+@njit(cache=True, nogil=True, error_model="numpy")
+def money_flow_index(high, low, close, volume, window):
+    """
+    MFI from rolling sums of positive and negative money flow in a single pass.
+
+    A bar's flow (typical price times volume) is positive or negative when
+    its typical price rose or fell; otherwise, and on the first bar, it
+    counts as zero.
+    """
+    n = close.shape[0]
+    out = np.empty(n, dtype=close.dtype)
+    # Ring buffers of the positive/negative flows currently in the window
+    positive = np.empty(window)
+    negative = np.empty(window)
+    positive_state = np.empty(7)
+    negative_state = np.empty(7)
+
+    slot = 0
+    prev_tp = np.nan
+    for i in range(n):
+        tp = (np.float64(high[i]) + low[i] + close[i]) / 3
+        flow = tp * volume[i]
+        pos = flow if tp > prev_tp else 0.0
+        neg = flow if tp < prev_tp else 0.0
+        prev_tp = tp
+
+        if i == 0 or window == 1:
+            _state_reset(positive_state, pos)
+            _state_reset(negative_state, neg)
+        elif i >= window:
+            _mean_remove(positive_state, positive[slot])
+            _mean_remove(negative_state, negative[slot])
+        positive[slot] = pos
+        negative[slot] = neg
+        _mean_add(positive_state, pos)
+        _mean_add(negative_state, neg)
+        slot = slot + 1 if slot + 1 < window else 0
+
+        ratio = _sum_value(positive_state, window) / _sum_value(negative_state, window)
+        out[i] = 100 - (100 / (1 + ratio))
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def bollinger_bands(values, window, num_std):
+    """
+    Rolling mean, standard deviation and both bands in a single pass.
+
+    Returns:
+        Tuple of (upper band, middle band, lower band) arrays
+    """
+    n = values.shape[0]
+    upper = np.empty(n, dtype=values.dtype)
+    middle = np.empty(n, dtype=values.dtype)
+    lower = np.empty(n, dtype=values.dtype)
+    mean_state = np.empty(7)
+    var_state = np.empty(7)
+
+    for i in range(n):
+        if i == 0 or window == 1:
+            _state_reset(mean_state, values[i])
+            _state_reset(var_state, values[i])
+        elif i >= window:
+            _mean_remove(mean_state, values[i - window])
+            _var_remove(var_state, values[i - window])
+        _mean_add(mean_state, values[i])
+        _var_add(var_state, values[i])
+
+        sma = _mean_value(mean_state, window)
+        band = _std_value(var_state, window) * num_std
+        upper[i] = sma + band
+        middle[i] = sma
+        lower[i] = sma - band
+
+    return upper, middle, lower
+
+
+@njit(cache=True, nogil=True, error_model="numpy")
+def stochastic(high, low, close, k_window, d_window):
+    """
+    %K from O(1) amortized rolling high/low extrema and %D from its rolling
+    mean, in a single pass.
+
+    Returns:
+        Tuple of (%K, %D) arrays
+    """
+    n = close.shape[0]
+    k_percent = np.empty(n, dtype=close.dtype)
+    d_percent = np.empty(n, dtype=close.dtype)
+    max_deque, max_bounds = _deque_new(k_window)
+    min_deque, min_bounds = _deque_new(k_window)
+    d_state = np.empty(7)
+    # Number of NaN highs/lows in the current window
+    missing = 0
+
+    for i in range(n):
+        _deque_push(max_deque, max_bounds, high, i, k_window, 1.0)
+        _deque_push(min_deque, min_bounds, low, i, k_window, -1.0)
+        missing += (high[i] != high[i]) + (low[i] != low[i])
+        if i >= k_window:
+            j = i - k_window
+            missing -= (high[j] != high[j]) + (low[j] != low[j])
+
+        if i < k_window - 1 or missing:
+            k_percent[i] = np.nan
+        else:
+            highest_high = high[_deque_head(max_deque, max_bounds)]
+            lowest_low = low[_deque_head(min_deque, min_bounds)]
+            k_percent[i] = 100 * ((close[i] - lowest_low) / (highest_high - lowest_low))
+
+        if i == 0 or d_window == 1:
+            _state_reset(d_state, k_percent[i])
+        elif i >= d_window:
+            _mean_remove(d_state, k_percent[i - d_window])
+        _mean_add(d_state, k_percent[i])
+        d_percent[i] = _mean_value(d_state, d_window)
+
+    return k_percent, d_percent
+
+
+def warm_up() -> None:
+    """
+    Compile every kernel for float64 and float32 inputs.
+
+    The compiled code lands in Numba's on-disk cache, so running this once at
+    build time (see the Dockerfile) spares later processes the JIT latency on
+    their first indicator call.
+    """
+    for dtype in (np.float64, np.float32):
+        values = np.linspace(1.0, 2.0, 64).astype(dtype)
+        high = values + dtype(0.5)
+        low = values - dtype(0.5)
+        rolling_mean(values, 5)
+        rolling_sum(values, 5)
+        rolling_std(values, 5)
+        rolling_max(values, 5)
+        rolling_min(values, 5)
+        rolling_mean_deviation(values, 5)
+        ewm_mean(values, 0.5)
+        macd(values, 3, 6, 2)
+        rsi(values, 5)
+        bollinger_bands(values, 5, 2.0)
+        stochastic(high, low, values, 5, 3)
+        money_flow_index(high, low, values, values, 5)
+        on_balance_volume(values, values)
+        cumulative_vwap(high, low, values, values)
@@ -0,0 +1,96 @@
+"""
+Indicator result cache shared between strategies.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class IndicatorCache:
+    """
+    LRU cache of indicator results keyed by input data, indicator and params.
+
+    Strategies sharing a cache (an ensemble, or a parameter sweep that only
+    varies signal thresholds) compute each indicator once per dataset.
+
+    Inputs are identified by a digest of their contents, so any in-place edit
+    of the data misses the cache. Entries hold only the results, and a lock
+    makes the cache safe to share between threads.
+    """
+
+    def __init__(self, maxsize: int = 16):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of indicator results kept
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self,
+        name: str,
+        compute: Callable[..., Any],
+        inputs: Tuple[pd.Series, ...],
+        params: Tuple[Any, ...],
+    ) -> Any:
+        """
+        Compute an indicator, or reuse the result for identical inputs and params.
+
+        Args:
+            name: Indicator name, part of the cache key
+            compute: Indicator function, called as ``compute(*inputs, *params)``
+            inputs: Input series
+            params: Indicator parameters
+
+        Returns:
+            Read-only ndarray, or tuple of ndarrays for multi-output indicators
+        """
+        key = (name, params) + tuple(_fingerprint(series) for series in inputs)
+
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                return result
+
+        result = compute(*inputs, *params)
+        if isinstance(result, tuple):
+            result = tuple(_read_only(series) for series in result)
+        else:
+            result = _read_only(result)
+
+        with self._lock:
+            self._entries[key] = result
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _fingerprint(series: pd.Series) -> Tuple[Any, ...]:
+    """Identify a series by its dtype, length and a digest of its values."""
+    array = np.ascontiguousarray(series.to_numpy())
+    digest = hashlib.blake2b(memoryview(array), digest_size=16).digest()
+    return array.dtype.str, len(array), digest
+
+
+def _read_only(series: pd.Series) -> np.ndarray:
+    """Return the series values as a read-only array."""
+    array = series.to_numpy()
+    array.flags.writeable = False
+    return array
@@ -4,10 +4,14 @@ Common technical analysis indicators used in trading strategies.
 """
 
 import logging
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from numpy.typing import DTypeLike
+
+from . import _kernels
 
 logger = logging.getLogger(__name__)
 
@@ -21,13 +25,17 @@ class TechnicalIndicators:
     """
 
     @staticmethod
-    def simple_moving_average(data: pd.Series, window: int) -> pd.Series:
+    def simple_moving_average(
+        data: pd.Series, window: int, dtype: DTypeLike = np.float64
+    ) -> pd.Series:
         """
         Calculate Simple Moving Average (SMA).
 
         Args:
             data: Price series
             window: Number of periods
+            dtype: Floating dtype of the computation and result; float32 halves
+                memory traffic on long series (default: float64)
 
         Returns:
             SMA series
@@ -37,11 +45,16 @@ class TechnicalIndicators:
                 f"Insufficient data for SMA calculation: {len(data)} < {window}"
             )
 
-        return data.rolling(window=window).mean()
+        sma = _kernels.rolling_mean(data.to_numpy(dtype=dtype), window)
+
+        return pd.Series(sma, index=data.index, name=data.name)
 
     @staticmethod
     def exponential_moving_average(
-        data: pd.Series, window: int, alpha: Optional[float] = None
+        data: pd.Series,
+        window: int,
+        alpha: Optional[float] = None,
+        dtype: DTypeLike = np.float64,
     ) -> pd.Series:
         """
         Calculate Exponential Moving Average (EMA).
@@ -50,6 +63,8 @@ class TechnicalIndicators:
             data: Price series
             window: Number of periods
             alpha: Smoothing factor (if None, calculated as 2/(window+1))
+            dtype: Floating dtype of the computation and result; float32 halves
+                memory traffic on long series (default: float64)
 
         Returns:
             EMA series
@@ -57,16 +72,25 @@ class TechnicalIndicators:
         if alpha is None:
             alpha = 2.0 / (window + 1)
 
-        return data.ewm(alpha=alpha, adjust=False).mean()
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must satisfy: 0 < alpha <= 1")
+
+        ema = _kernels.ewm_mean(data.to_numpy(dtype=dtype), alpha)
+
+        return pd.Series(ema, index=data.index, name=data.name)
 
     @staticmethod
-    def rsi(data: pd.Series, window: int = 14) -> pd.Series:
+    def rsi(
+        data: pd.Series, window: int = 14, dtype: DTypeLike = np.float64
+    ) -> pd.Series:
         """
         Calculate Relative Strength Index (RSI).
 
         Args:
             data: Price series
             window: Number of periods (default: 14)
+            dtype: Floating dtype of the computation and result; float32 halves
+                memory traffic on long series (default: float64)
 
         Returns:
             RSI series (0-100)
@@ -75,23 +99,19 @@ class TechnicalIndicators:
             logger.warning(
                 f"Insufficient data for RSI calculation: {len(data)} < {window + 1}"
             )
-            return pd.Series(index=data.index, dtype=float)
-
-        delta = data.diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-
-        avg_gain = gain.rolling(window=window).mean()
-        avg_loss = loss.rolling(window=window).mean()
+            return pd.Series(index=data.index, dtype=dtype)
 
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+        rsi = _kernels.rsi(data.to_numpy(dtype=dtype), window)
 
-        return rsi
+        return pd.Series(rsi, index=data.index, name=data.name)
 
     @staticmethod
     def macd(
-        data: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9
+        data: pd.Series,
+        fast: int = 12,
+        slow: int = 26,
+        signal: int = 9,
+        dtype: DTypeLike = np.float64,
     ) -> Tuple[pd.Series, pd.Series, pd.Series]:
         """
         Calculate MACD (Moving Average Convergence Divergence).
@@ -101,6 +121,8 @@ class TechnicalIndicators:
             fast: Fast EMA period (default: 12)
             slow: Slow EMA period (default: 26)
             signal: Signal line EMA period (default: 9)
+            dtype: Floating dtype of the computation and result; float32 halves
+                memory traffic on long series (default: float64)
 
         Returns:
             Tuple of (MACD line, Signal line, Histogram)
@@ -109,21 +131,22 @@ class TechnicalIndicators:
             logger.warning(
                 f"Insufficient data for MACD calculation: {len(data)} < {slow}"
             )
-            empty_series = pd.Series(index=data.index, dtype=float)
+            empty_series = pd.Series(index=data.index, dtype=dtype)
             return empty_series, empty_series, empty_series
 
-        ema_fast = TechnicalIndicators.exponential_moving_average(data, fast)
-        ema_slow = TechnicalIndicators.exponential_moving_average(data, slow)
-
-        macd_line = ema_fast - ema_slow
-        signal_line = TechnicalIndicators.exponential_moving_average(macd_line, signal)
-        histogram = macd_line - signal_line
+        lines = _kernels.macd(data.to_numpy(dtype=dtype), fast, slow, signal)
+        macd_line, signal_line, histogram = (
+            pd.Series(line, index=data.index, name=data.name) for line in lines
+        )
 
         return macd_line, signal_line, histogram
 
     @staticmethod
     def bollinger_bands(
-        data: pd.Series, window: int = 20, num_std: float = 2.0
+        data: pd.Series,
+        window: int = 20,
+        num_std: float = 2.0,
+        dtype: DTypeLike = np.float64,
     ) -> Tuple[pd.Series, pd.Series, pd.Series]:
         """
         Calculate Bollinger Bands.
@@ -132,6 +155,8 @@ class TechnicalIndicators:
             data: Price series
             window: Number of periods (default: 20)
             num_std: Number of standard deviations (default: 2.0)
+            dtype: Floating dtype of the computation and result; float32 halves
+                memory traffic on long series (default: float64)
 
         Returns:
             Tuple of (Upper band, Middle band/SMA, Lower band)
@@ -140,14 +165,13 @@ class TechnicalIndicators:
             logger.warning(
                 f"Insufficient data for Bollinger Bands calculation: {len(data)} < {window}"
             )
-            empty_series = pd.Series(index=data.index, dtype=float)
+            empty_series = pd.Series(index=data.index, dtype=dtype)
             return empty_series, empty_series, empty_series
 
-        sma = TechnicalIndicators.simple_moving_average(data, window)
-        std = data.rolling(window=window).std()
-
-        upper_band = sma + (std * num_std)
-        lower_band = sma - (std * num_std)
+        bands = _kernels.bollinger_bands(data.to_numpy(dtype=dtype), window, num_std)
+        upper_band, sma, lower_band = (
+            pd.Series(band, index=data.index, name=data.name) for band in bands
+        )
 
         return upper_band, sma, lower_band
 
@@ -158,6 +182,7 @@ class TechnicalIndicators:
         close: pd.Series,
         k_window: int = 14,
         d_window: int = 3,
+        dtype: DTypeLike = np.float64,
     ) -> Tuple[pd.Series, pd.Series]:
         """
         Calculate Stochastic Oscillator.
@@ -168,6 +193,8 @@ class TechnicalIndicators:
             close: Close price series
             k_window: %K period (default: 14)
             d_window: %D period (default: 3)
+            dtype: Floating dtype of the computation and result; float32 halves
+                memory traffic on long series (default: float64)
 
         Returns:
             Tuple of (%K, %D)
@@ -176,20 +203,29 @@ class TechnicalIndicators:
             logger.warning(
                 f"Insufficient data for Stochastic calculation: {len(close)} < {k_window}"
             )
-            empty_series = pd.Series(index=close.index, dtype=float)
+            empty_series = pd.Series(index=close.index, dtype=dtype)
             return empty_series, empty_series
 
-        lowest_low = low.rolling(window=k_window).min()
-        highest_high = high.rolling(window=k_window).max()
-
-        k_percent = 100 * ((close - lowest_low) / (highest_high - lowest_low))
-        d_percent = k_percent.rolling(window=d_window).mean()
+        k_percent, d_percent = _kernels.stochastic(
+            high.to_numpy(dtype=dtype),
+            low.to_numpy(dtype=dtype),
+            close.to_numpy(dtype=dtype),
+            k_window,
+            d_window,
+        )
 
-        return k_percent, d_percent
+        return (
+            pd.Series(k_percent, index=close.index),
+            pd.Series(d_percent, index=close.index),
+        )
 
     @staticmethod
     def average_true_range(
-        high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14
+        high: pd.Series,
+        low: pd.Series,
+        close: pd.Series,
+        window: int = 14,
+        dtype: DTypeLike = np.float64,
     ) -> pd.Series:
         """
         Calculate Average True Range (ATR).
@@ -199,26 +235,39 @@ class TechnicalIndicators:
             low: Low price series
             close: Close price series
             window: Number of periods (default: 14)
+            dtype: Floating dtype of the computation and result; float32 halves
+                memory traffic on long series (default: float64)
 
         Returns:
             ATR series
         """
         if len(close) < 2:
             logger.warning("Insufficient data for ATR calculation")
-            return pd.Series(index=close.index, dtype=float)
+            return pd.Series(index=close.index, dtype=dtype)
 
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
+        high_np = high.to_numpy(dtype=dtype)
+        low_np = low.to_numpy(dtype=dtype)
+        prev_close = np.empty(len(close), dtype=dtype)
+        prev_close[0] = np.nan
+        prev_close[1:] = close.to_numpy(dtype=dtype)[:-1]
 
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = true_range.rolling(window=window).mean()
+        # Largest of the three ranges, ignoring the missing previous close
+        true_range = np.subtract(high_np, low_np)
+        gap = np.subtract(low_np, prev_close)
+        np.subtract(high_np, prev_close, out=prev_close)
+        np.fmax(true_range, np.abs(prev_close, out=prev_close), out=true_range)
+        np.fmax(true_range, np.abs(gap, out=gap), out=true_range)
+        atr = _kernels.rolling_mean(true_range, window)
 
-        return atr
+        return pd.Series(atr, index=close.index)
 
     @staticmethod
     def williams_r(
-        high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14
+        high: pd.Series,
+        low: pd.Series,
+        close: pd.Series,
+        window: int = 14,
+        dtype: DTypeLike = np.float64,
     ) -> pd.Series:
         """
         Calculate Williams %R.
@@ -228,6 +277,8 @@ class TechnicalIndicators:
             low: Low price series
             close: Close price series
             window: Number of periods (default: 14)
+            dtype: Floating dtype of the computation and result; float32 halves
+                memory traffic on long series (default: float64)
 
         Returns:
             Williams %R series (-100 to 0)
@@ -236,14 +287,19 @@ class TechnicalIndicators:
             logger.warning(
                 f"Insufficient data for Williams %R calculation: {len(close)} < {window}"
             )
-            return pd.Series(index=close.index, dtype=float)
+            return pd.Series(index=close.index, dtype=dtype)
 
-        highest_high = high.rolling(window=window).max()
-        lowest_low = low.rolling(window=window).min()
+        highest_high = _kernels.rolling_max(high.to_numpy(dtype=dtype), window)
+        lowest_low = _kernels.rolling_min(low.to_numpy(dtype=dtype), window)
 
-        williams_r = -100 * ((highest_high - close) / (highest_high - lowest_low))
+        # -100 * (hh - close) / (hh - ll), reusing the extrema buffers
+        williams_r = np.subtract(highest_high, close.to_numpy(dtype=dtype))
+        np.subtract(highest_high, lowest_low, out=lowest_low)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(williams_r, lowest_low, out=williams_r)
+        np.multiply(williams_r, -100, out=williams_r)
 
-        return williams_r
+        return pd.Series(williams_r, index=close.index)
 
     @staticmethod
     def commodity_channel_index(
@@ -252,6 +308,7 @@ class TechnicalIndicators:
         close: pd.Series,
         window: int = 20,
         constant: float = 0.015,
+        dtype: DTypeLike = np.float64,
     ) -> pd.Series:
         """
         Calculate Commodity Channel Index (CCI).
@@ -262,6 +319,8 @@ class TechnicalIndicators:
             close: Close price series
             window: Number of periods (default: 20)
             constant: Constant factor (default: 0.015)
+            dtype: Floating dtype of the computation and result; float32 halves
+                memory traffic on long series (default: float64)
 
         Returns:
             CCI series
@@ -270,17 +329,19 @@ class TechnicalIndicators:
             logger.warning(
                 f"Insufficient data for CCI calculation: {len(close)} < {window}"
             )
-            return pd.Series(index=close.index, dtype=float)
+            return pd.Series(index=close.index, dtype=dtype)
 
-        typical_price = (high + low + close) / 3
-        sma_tp = typical_price.rolling(window=window).mean()
-        mean_deviation = typical_price.rolling(window=window).apply(
-            lambda x: np.mean(np.abs(x - np.mean(x)))
-        )
+        typical_price = TechnicalIndicators._typical_price(high, low, close, dtype)
+        sma_tp = _kernels.rolling_mean(typical_price, window)
+        mean_deviation = _kernels.rolling_mean_deviation(typical_price, window)
 
-        cci = (typical_price - sma_tp) / (constant * mean_deviation)
+        # (tp - sma) / (constant * mean deviation), reusing the kernel outputs
+        cci = np.subtract(typical_price, sma_tp, out=sma_tp)
+        np.multiply(mean_deviation, constant, out=mean_deviation)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(cci, mean_deviation, out=cci)
 
-        return cci
+        return pd.Series(cci, index=close.index)
 
     @staticmethod
     def money_flow_index(
@@ -289,6 +350,7 @@ class TechnicalIndicators:
         close: pd.Series,
         volume: pd.Series,
         window: int = 14,
+        dtype: DTypeLike = np.float64,
     ) -> pd.Series:
         """
         Calculate Money Flow Index (MFI).
@@ -299,6 +361,8 @@ class TechnicalIndicators:
             close: Close price series
             volume: Volume series
             window: Number of periods (default: 14)
+            dtype: Floating dtype of the computation and result; float32 halves
+                memory traffic on long series (default: float64)
 
         Returns:
             MFI series (0-100)
@@ -307,45 +371,43 @@ class TechnicalIndicators:
             logger.warning(
                 f"Insufficient data for MFI calculation: {len(close)} < {window + 1}"
             )
-            return pd.Series(index=close.index, dtype=float)
-
-        typical_price = (high + low + close) / 3
-        money_flow = typical_price * volume
-
-        positive_flow = money_flow.where(typical_price > typical_price.shift(1), 0)
-        negative_flow = money_flow.where(typical_price < typical_price.shift(1), 0)
-
-        positive_mf = positive_flow.rolling(window=window).sum()
-        negative_mf = negative_flow.rolling(window=window).sum()
-
-        money_ratio = positive_mf / negative_mf
-        mfi = 100 - (100 / (1 + money_ratio))
+            return pd.Series(index=close.index, dtype=dtype)
+
+        mfi = _kernels.money_flow_index(
+            high.to_numpy(dtype=dtype),
+            low.to_numpy(dtype=dtype),
+            close.to_numpy(dtype=dtype),
+            volume.to_numpy(dtype=dtype),
+            window,
+        )
 
-        return mfi
+        return pd.Series(mfi, index=close.index)
 
     @staticmethod
-    def on_balance_volume(close: pd.Series, volume: pd.Series) -> pd.Series:
+    def on_balance_volume(
+        close: pd.Series, volume: pd.Series, dtype: DTypeLike = np.float64
+    ) -> pd.Series:
         """
         Calculate On-Balance Volume (OBV).
 
         Args:
             close: Close price series
             volume: Volume series
+            dtype: Floating dtype of the computation and result; float32 halves
+                memory traffic on long series (default: float64)
 
         Returns:
             OBV series
         """
         if len(close) < 2:
             logger.warning("Insufficient data for OBV calculation")
-            return pd.Series(index=close.index, dtype=float)
+            return pd.Series(index=close.index, dtype=dtype)
 
-        direction = np.where(
-            close > close.shift(1), 1, np.where(close < close.shift(1), -1, 0)
+        obv = _kernels.on_balance_volume(
+            close.to_numpy(dtype=dtype), volume.to_numpy(dtype=dtype)
         )
 
-        obv = (direction * volume).cumsum()
-
-        return obv
+        return pd.Series(obv, index=volume.index, name=volume.name)
 
     @staticmethod
     def volume_weighted_average_price(
@@ -354,6 +416,7 @@ class TechnicalIndicators:
         close: pd.Series,
         volume: pd.Series,
         window: Optional[int] = None,
+        dtype: DTypeLike = np.float64,
     ) -> pd.Series:
         """
         Calculate Volume Weighted Average Price (VWAP).
@@ -364,21 +427,135 @@ class TechnicalIndicators:
             close: Close price series
             volume: Volume series
             window: Rolling window (if None, uses cumulative VWAP)
+            dtype: Floating dtype of the computation and result; float32 halves
+                memory traffic on long series (default: float64)
 
         Returns:
             VWAP series
         """
-        typical_price = (high + low + close) / 3
-        vwap_numerator = typical_price * volume
-
         if window is None:
             # Cumulative VWAP
-            vwap = vwap_numerator.cumsum() / volume.cumsum()
+            vwap = _kernels.cumulative_vwap(
+                high.to_numpy(dtype=dtype),
+                low.to_numpy(dtype=dtype),
+                close.to_numpy(dtype=dtype),
+                volume.to_numpy(dtype=dtype),
+            )
         else:
             # Rolling VWAP
-            vwap = (
-                vwap_numerator.rolling(window=window).sum()
-                / volume.rolling(window=window).sum()
-            )
+            volume_np = volume.to_numpy(dtype=dtype)
+            vwap_numerator = TechnicalIndicators._typical_price(high, low, close, dtype)
+            vwap_numerator *= volume_np
+
+            vwap = _kernels.rolling_sum(vwap_numerator, window)
+            denominator = _kernels.rolling_sum(volume_np, window)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                vwap /= denominator
+
+        return pd.Series(vwap, index=close.index)
+
+    @staticmethod
+    def simple_moving_average_batch(
+        data: Union[pd.DataFrame, np.ndarray],
+        window: int,
+        dtype: DTypeLike = np.float64,
+    ) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Calculate the SMA of many series at once.
 
-        return vwap
+        Args:
+            data: Price matrix, one column per symbol (rows are time)
+            window: Number of periods
+            dtype: Floating dtype of the computation and result (default: float64)
+
+        Returns:
+            SMA matrix of the same shape and type as ``data``
+        """
+        return TechnicalIndicators._batch(_kernels.rolling_mean, data, (window,), dtype)
+
+    @staticmethod
+    def exponential_moving_average_batch(
+        data: Union[pd.DataFrame, np.ndarray],
+        window: int,
+        alpha: Optional[float] = None,
+        dtype: DTypeLike = np.float64,
+    ) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Calculate the EMA of many series at once.
+
+        Args:
+            data: Price matrix, one column per symbol (rows are time)
+            window: Number of periods
+            alpha: Smoothing factor (if None, calculated as 2/(window+1))
+            dtype: Floating dtype of the computation and result (default: float64)
+
+        Returns:
+            EMA matrix of the same shape and type as ``data``
+        """
+        if alpha is None:
+            alpha = 2.0 / (window + 1)
+
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must satisfy: 0 < alpha <= 1")
+
+        return TechnicalIndicators._batch(_kernels.ewm_mean, data, (alpha,), dtype)
+
+    @staticmethod
+    def rsi_batch(
+        data: Union[pd.DataFrame, np.ndarray],
+        window: int = 14,
+        dtype: DTypeLike = np.float64,
+    ) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Calculate the RSI of many series at once.
+
+        Args:
+            data: Price matrix, one column per symbol (rows are time)
+            window: Number of periods (default: 14)
+            dtype: Floating dtype of the computation and result (default: float64)
+
+        Returns:
+            RSI matrix (0-100) of the same shape and type as ``data``
+        """
+        return TechnicalIndicators._batch(_kernels.rsi, data, (window,), dtype)
+
+    @staticmethod
+    def _batch(
+        kernel: Callable[..., np.ndarray],
+        data: Union[pd.DataFrame, np.ndarray],
+        args: Tuple[Any, ...],
+        dtype: DTypeLike,
+    ) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Apply a single-series kernel to every column of a matrix.
+
+        The matrix is laid out column-major so each column is contiguous, and
+        columns are spread over a thread pool; the kernels release the GIL,
+        so they run in parallel.
+        """
+        values = np.asfortranarray(
+            data.to_numpy(dtype=dtype) if isinstance(data, pd.DataFrame) else data,
+            dtype=dtype,
+        )
+        if values.ndim != 2:
+            raise ValueError(f"Expected a 2-D matrix, got {values.ndim} dimensions")
+
+        result = np.empty_like(values)
+        with ThreadPoolExecutor() as pool:
+            columns = pool.map(lambda column: kernel(column, *args), values.T)
+            for j, column in enumerate(columns):
+                result[:, j] = column
+
+        if isinstance(data, pd.DataFrame):
+            return pd.DataFrame(result, index=data.index, columns=data.columns)
+        return result
+
+    @staticmethod
+    def _typical_price(
+        high: pd.Series, low: pd.Series, close: pd.Series, dtype: DTypeLike
+    ) -> np.ndarray:
+        """Typical price (high + low + close) / 3 as an array of ``dtype``."""
+        typical_price = high.to_numpy(dtype=dtype) + low.to_numpy(dtype=dtype)
+        typical_price += close.to_numpy(dtype=dtype)
+        typical_price /= 3
+        return typical_price
@@ -4,16 +4,28 @@ Manages registration, discovery, and instantiation of trading strategies.
 """
 
 import importlib
+import inspect
 import logging
 import pkgutil
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Set, Type
 
 from .base_strategy import BaseStrategy
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class StrategyRecord:
+    """A registered strategy class with its metadata and info dictionary."""
+
+    cls: Type[BaseStrategy]
+    metadata: Dict[str, Any]
+    info: Dict[str, Any]
+
+
 class StrategyRegistry:
     """
     Central registry for managing trading strategies.
@@ -23,8 +35,9 @@ class StrategyRegistry:
     """
 
     def __init__(self):
-        self._strategies: Dict[str, Type[BaseStrategy]] = {}
-        self._strategy_metadata: Dict[str, Dict[str, Any]] = {}
+        self._records: Dict[str, StrategyRecord] = {}
+        # Packages already walked by discover_strategies
+        self._discovered: Set[str] = set()
 
     def register(
         self,
@@ -48,11 +61,23 @@ class StrategyRegistry:
                 f"Strategy class {strategy_class} must inherit from BaseStrategy"
             )
 
-        if name in self._strategies:
+        if name in self._records:
             logger.warning(f"Strategy '{name}' already registered, overwriting")
 
-        self._strategies[name] = strategy_class
-        self._strategy_metadata[name] = metadata or {}
+        # Interned keys make lookups with literal names an identity comparison
+        name = sys.intern(name)
+
+        # The class attributes are fixed, so the info dict is built only once;
+        # callers get copies so they cannot change the registered one
+        metadata = metadata or {}
+        info = {
+            "name": name,
+            "class": strategy_class.__name__,
+            "module": strategy_class.__module__,
+            "docstring": strategy_class.__doc__,
+            "metadata": metadata,
+        }
+        self._records[name] = StrategyRecord(strategy_class, metadata, info)
 
         logger.info(f"Registered strategy: {name}")
 
@@ -63,10 +88,8 @@ class StrategyRegistry:
         Args:
             name: Strategy identifier to remove
         """
-        if name in self._strategies:
-            del self._strategies[name]
-            if name in self._strategy_metadata:
-                del self._strategy_metadata[name]
+        if name in self._records:
+            del self._records[name]
             logger.info(f"Unregistered strategy: {name}")
         else:
             logger.warning(f"Strategy '{name}' not found for unregistration")
@@ -84,10 +107,11 @@ class StrategyRegistry:
         Raises:
             KeyError: If strategy not found
         """
-        if name not in self._strategies:
+        record = self._records.get(name)
+        if record is None:
             raise KeyError(f"Strategy '{name}' not found in registry")
 
-        return self._strategies[name]
+        return record.cls
 
     def create_strategy(
         self, name: str, params: Optional[Dict[str, Any]] = None
@@ -120,7 +144,7 @@ class StrategyRegistry:
         Returns:
             List of strategy names
         """
-        return list(self._strategies.keys())
+        return list(self._records.keys())
 
     def get_strategy_info(self, name: str) -> Dict[str, Any]:
         """
@@ -135,19 +159,11 @@ class StrategyRegistry:
         Raises:
             KeyError: If strategy not found
         """
-        if name not in self._strategies:
+        record = self._records.get(name)
+        if record is None:
             raise KeyError(f"Strategy '{name}' not found in registry")
 
-        strategy_class = self._strategies[name]
-        metadata = self._strategy_metadata[name]
-
-        return {
-            "name": name,
-            "class": strategy_class.__name__,
-            "module": strategy_class.__module__,
-            "docstring": strategy_class.__doc__,
-            "metadata": metadata,
-        }
+        return dict(record.info)
 
     def get_all_strategies_info(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -156,7 +172,7 @@ class StrategyRegistry:
         Returns:
             Dictionary mapping strategy names to their information
         """
-        return {name: self.get_strategy_info(name) for name in self.list_strategies()}
+        return {name: dict(record.info) for name, record in self._records.items()}
 
     def discover_strategies(
         self, package_path: str = "src.backend.strategies.implementations"
@@ -164,12 +180,18 @@ class StrategyRegistry:
         """
         Automatically discover and register strategies from a package.
 
+        Each package is only walked once per registry; later calls for the
+        same package return immediately.
+
         Args:
             package_path: Python package path to search for strategies
 
         Returns:
             Number of strategies discovered and registered
         """
+        if package_path in self._discovered:
+            return 0
+
         discovered_count = 0
 
         try:
@@ -193,23 +215,21 @@ class StrategyRegistry:
                     full_module_name = f"{package_path}.{modname}"
                     module = importlib.import_module(full_module_name)
 
-                    # Look for strategy classes
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-
-                        # Check if it's a strategy class
-                        if (
-                            isinstance(attr, type)
-                            and issubclass(attr, BaseStrategy)
-                            and attr != BaseStrategy
-                        ):
-
-                            # Register the strategy
-                            strategy_name = getattr(
-                                attr, "STRATEGY_NAME", attr.__name__.lower()
-                            )
-                            self.register(strategy_name, attr)
-                            discovered_count += 1
+                    # Look for strategy classes defined in this module (not
+                    # re-exported from elsewhere)
+                    for _, attr in inspect.getmembers(
+                        module,
+                        lambda obj: isinstance(obj, type)
+                        and obj.__module__ == module.__name__
+                        and issubclass(obj, BaseStrategy)
+                        and obj is not BaseStrategy,
+                    ):
+                        # Register the strategy
+                        strategy_name = getattr(
+                            attr, "STRATEGY_NAME", attr.__name__.lower()
+                        )
+                        self.register(strategy_name, attr)
+                        discovered_count += 1
 
                 except ImportError as e:
                     logger.warning(f"Could not import module {modname}: {str(e)}")
@@ -218,6 +238,8 @@ class StrategyRegistry:
                     logger.error(f"Error processing module {modname}: {str(e)}")
                     continue
 
+            self._discovered.add(package_path)
+
         except ImportError as e:
             logger.error(f"Could not import package {package_path}: {str(e)}")
 
@@ -239,7 +261,7 @@ class StrategyRegistry:
         """
         try:
             # Check if strategy exists
-            if name not in self._strategies:
+            if name not in self._records:
                 return False, f"Strategy '{name}' not found in registry"
 
             # Try to create an instance with the parameters
@@ -256,8 +278,8 @@ class StrategyRegistry:
 
     def clear(self) -> None:
         """Clear all registered strategies."""
-        self._strategies.clear()
-        self._strategy_metadata.clear()
+        self._records.clear()
+        self._discovered.clear()
         logger.info("Cleared all registered strategies")
 
 
@@ -0,0 +1,9 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def settings():
+    """Application settings, imported once for the whole session."""
+    return pytest.importorskip("tradingbot.config.settings").settings
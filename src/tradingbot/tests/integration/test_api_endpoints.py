@@ -1,37 +1,5 @@
 """Integration tests for API endpoints."""
 
-import sys
-
-import pytest
-from fastapi.testclient import TestClient
-
-
-# Handle Python version compatibility
-def safe_import_app():
-    """Safely import the FastAPI app with version compatibility."""
-    try:
-        from tradingbot.main import app
-
-        return app
-    except ImportError as e:
-        error_msg = str(e)
-        if "UTC" in error_msg and sys.version_info < (3, 11):
-            pytest.skip(
-                "Python 3.10 datetime.UTC compatibility issue", allow_module_level=True
-            )
-        else:
-            pytest.skip(f"Failed to import FastAPI app: {e}", allow_module_level=True)
-
-
-# Import app safely
-app = safe_import_app()
-
-
-@pytest.fixture
-def client():
-    """Create a test client."""
-    return TestClient(app)
-
 
 class TestHealthEndpoint:
     """Test health check endpoint."""
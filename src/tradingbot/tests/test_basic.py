@@ -1,46 +1,48 @@
 """Basic test to verify the package can be imported."""
 
-import pytest
-
-
-def test_tradingbot_import():
-    """Test that the main tradingbot package can be imported."""
-    try:
-        import tradingbot
-
-        assert hasattr(tradingbot, "__version__") or True  # Package exists
-    except ImportError:
-        pytest.fail("Could not import tradingbot package")
-
-
-def test_main_module_import():
-    """Test that the main module can be imported."""
-    try:
-        from tradingbot import main
-
-        assert hasattr(main, "app")
-    except ImportError:
-        pytest.fail("Could not import tradingbot.main module")
-
-
-def test_config_import():
-    """Test that config modules can be imported."""
-    try:
-        from tradingbot.config import settings
-
-        assert settings is not None
-    except ImportError:
-        pytest.fail("Could not import tradingbot.config.settings")
+import importlib
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
 
+import pytest
 
-def test_models_import():
-    """Test that model modules can be imported."""
-    try:
-        from tradingbot.models import base
 
-        assert hasattr(base, "Base")
-    except ImportError:
-        pytest.fail("Could not import tradingbot.models.base")
+@pytest.mark.parametrize(
+    "module,attribute",
+    [
+        ("tradingbot", None),
+        ("tradingbot.main", "app"),
+        ("tradingbot.config.settings", "settings"),
+        ("tradingbot.models.base", "Base"),
+    ],
+)
+def test_module_import(module, attribute):
+    """Test that the package and its core modules can be imported."""
+    imported = importlib.import_module(module)
+
+    if attribute is not None:
+        assert hasattr(imported, attribute)
+
+
+def test_eager_import(tmp_path):
+    """Test the app imports with every deferred dependency resolved up front."""
+    main = importlib.util.find_spec("tradingbot.main")
+    src = str(Path(main.origin).resolve().parents[1])
+    pythonpath = os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")]))
+    env = {**os.environ, "EAGER_IMPORT": "1", "PYTHONPATH": pythonpath}
+
+    # Run in a scratch directory so the app's logs and database stay out of the tree
+    result = subprocess.run(
+        [sys.executable, "-c", "import tradingbot.main"],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
 
 
 def test_sample_calculation():
@@ -0,0 +1,23 @@
+"""Shared fixtures for the unit tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def ohlcv():
+    """Synthetic OHLCV data with a random-walk close."""
+    rng = np.random.default_rng(42)
+    n = 500
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.002, n)),
+            "high": close * (1 + rng.uniform(0, 0.01, n)),
+            "low": close * (1 - rng.uniform(0, 0.01, n)),
+            "close": close,
+            "volume": rng.uniform(100, 1000, n),
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="h"),
+    )
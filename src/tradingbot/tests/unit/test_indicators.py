@@ -0,0 +1,179 @@
+"""Unit tests comparing the indicator kernels with plain pandas formulas."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingbot.strategies.indicators import TechnicalIndicators
+
+
+# Reference formulas: the pandas implementations the kernels replaced
+
+
+def reference_rsi(close, window=14):
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    rs = gain.rolling(window=window).mean() / loss.rolling(window=window).mean()
+    return 100 - (100 / (1 + rs))
+
+
+def reference_macd(close, fast=12, slow=26, signal=9):
+    macd_line = (
+        close.ewm(alpha=2.0 / (fast + 1), adjust=False).mean()
+        - close.ewm(alpha=2.0 / (slow + 1), adjust=False).mean()
+    )
+    signal_line = macd_line.ewm(alpha=2.0 / (signal + 1), adjust=False).mean()
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def reference_bollinger_bands(close, window=20, num_std=2.0):
+    sma = close.rolling(window=window).mean()
+    std = close.rolling(window=window).std()
+    return sma + (std * num_std), sma, sma - (std * num_std)
+
+
+def reference_stochastic(high, low, close, k_window=14, d_window=3):
+    lowest_low = low.rolling(window=k_window).min()
+    highest_high = high.rolling(window=k_window).max()
+    k_percent = 100 * ((close - lowest_low) / (highest_high - lowest_low))
+    return k_percent, k_percent.rolling(window=d_window).mean()
+
+
+def reference_atr(high, low, close, window=14):
+    true_range = pd.concat(
+        [high - low, abs(high - close.shift(1)), abs(low - close.shift(1))], axis=1
+    ).max(axis=1)
+    return true_range.rolling(window=window).mean()
+
+
+def reference_williams_r(high, low, close, window=14):
+    highest_high = high.rolling(window=window).max()
+    lowest_low = low.rolling(window=window).min()
+    return -100 * ((highest_high - close) / (highest_high - lowest_low))
+
+
+def reference_cci(high, low, close, window=20, constant=0.015):
+    typical_price = (high + low + close) / 3
+    sma_tp = typical_price.rolling(window=window).mean()
+    mean_deviation = typical_price.rolling(window=window).apply(
+        lambda x: np.mean(np.abs(x - np.mean(x)))
+    )
+    return (typical_price - sma_tp) / (constant * mean_deviation)
+
+
+def reference_mfi(high, low, close, volume, window=14):
+    typical_price = (high + low + close) / 3
+    money_flow = typical_price * volume
+    positive_flow = money_flow.where(typical_price > typical_price.shift(1), 0)
+    negative_flow = money_flow.where(typical_price < typical_price.shift(1), 0)
+    money_ratio = (
+        positive_flow.rolling(window=window).sum()
+        / negative_flow.rolling(window=window).sum()
+    )
+    return 100 - (100 / (1 + money_ratio))
+
+
+def reference_obv(close, volume):
+    direction = np.where(
+        close > close.shift(1), 1, np.where(close < close.shift(1), -1, 0)
+    )
+    return (direction * volume).cumsum()
+
+
+def reference_vwap(high, low, close, volume, window=None):
+    typical_price = (high + low + close) / 3
+    numerator = typical_price * volume
+    if window is None:
+        return numerator.cumsum() / volume.cumsum()
+    return numerator.rolling(window=window).sum() / volume.rolling(window=window).sum()
+
+
+CASES = [
+    pytest.param(["close"], TechnicalIndicators.rsi, reference_rsi, id="rsi"),
+    pytest.param(["close"], TechnicalIndicators.macd, reference_macd, id="macd"),
+    pytest.param(
+        ["close"],
+        TechnicalIndicators.bollinger_bands,
+        reference_bollinger_bands,
+        id="bollinger_bands",
+    ),
+    pytest.param(
+        ["high", "low", "close"],
+        TechnicalIndicators.stochastic_oscillator,
+        reference_stochastic,
+        id="stochastic",
+    ),
+    pytest.param(
+        ["high", "low", "close"],
+        TechnicalIndicators.average_true_range,
+        reference_atr,
+        id="atr",
+    ),
+    pytest.param(
+        ["high", "low", "close"],
+        TechnicalIndicators.williams_r,
+        reference_williams_r,
+        id="williams_r",
+    ),
+    pytest.param(
+        ["high", "low", "close"],
+        TechnicalIndicators.commodity_channel_index,
+        reference_cci,
+        id="cci",
+    ),
+    pytest.param(
+        ["high", "low", "close", "volume"],
+        TechnicalIndicators.money_flow_index,
+        reference_mfi,
+        id="mfi",
+    ),
+    pytest.param(
+        ["close", "volume"],
+        TechnicalIndicators.on_balance_volume,
+        reference_obv,
+        id="obv",
+    ),
+    pytest.param(
+        ["high", "low", "close", "volume"],
+        TechnicalIndicators.volume_weighted_average_price,
+        reference_vwap,
+        id="vwap",
+    ),
+    pytest.param(
+        ["high", "low", "close", "volume"],
+        lambda *args: TechnicalIndicators.volume_weighted_average_price(*args, 20),
+        lambda *args: reference_vwap(*args, 20),
+        id="rolling_vwap",
+    ),
+]
+
+
+@pytest.fixture(params=["clean", "nan", "flat"])
+def prices(request, ohlcv):
+    """OHLCV data as is, with scattered NaNs, or with a flat stretch."""
+    df = ohlcv.copy()
+    if request.param == "nan":
+        rng = np.random.default_rng(7)
+        for column in df:
+            df.iloc[
+                rng.choice(len(df), 10, replace=False), df.columns.get_loc(column)
+            ] = np.nan
+    elif request.param == "flat":
+        # Longer than every window, with no price change and no volume
+        df.iloc[100:160, :4] = 100.0
+        df.iloc[100:160, 4] = 0.0
+    return df
+
+
+@pytest.mark.parametrize("columns,indicator,reference", CASES)
+def test_matches_reference(prices, columns, indicator, reference):
+    """Test each indicator reproduces the pandas formula exactly."""
+    inputs = [prices[column] for column in columns]
+    result = indicator(*inputs)
+    expected = reference(*inputs)
+    if not isinstance(result, tuple):
+        result, expected = (result,), (expected,)
+
+    for actual, wanted in zip(result, expected):
+        np.testing.assert_array_equal(np.asarray(actual), np.asarray(wanted))
@@ -1,96 +1,59 @@
 """Unit tests for models module."""
+
 from unittest.mock import MagicMock
 
 import pytest
 
 
-class TestBaseModel:
-    """Test the base model functionality."""
+@pytest.mark.parametrize(
+    "module,attribute",
+    [
+        ("tradingbot.models.base", "Base"),
+        ("tradingbot.models.user", "User"),
+        ("tradingbot.models.strategy", "Strategy"),
+        ("tradingbot.models.market", "MarketData"),
+    ],
+)
+def test_model_importable(module, attribute):
+    """Test that each model class can be imported."""
+    assert getattr(pytest.importorskip(module), attribute) is not None
 
-    def test_base_model_import(self):
-        """Test that base model can be imported."""
-        try:
-            from tradingbot.models.base import Base
 
-            assert Base is not None
-        except ImportError:
-            pytest.skip("Base model not available")
+class TestBaseModel:
+    """Test the base model functionality."""
 
     def test_base_model_attributes(self):
         """Test base model has expected attributes."""
-        try:
-            from tradingbot.models.base import Base
-
-            # Test basic SQLAlchemy base functionality
-            assert hasattr(Base, "metadata")
-            assert hasattr(Base, "registry")
-        except (ImportError, AttributeError):
-            pytest.skip("Base model attributes not available")
+        base = pytest.importorskip("tradingbot.models.base")
+        # Test basic SQLAlchemy base functionality
+        assert hasattr(base.Base, "metadata")
+        assert hasattr(base.Base, "registry")
 
 
 class TestUserModel:
     """Test user model functionality."""
 
-    def test_user_model_import(self):
-        """Test that user model can be imported."""
-        try:
-            from tradingbot.models.user import User
-
-            assert User is not None
-        except ImportError:
-            pytest.skip("User model not available")
-
     def test_user_model_table_name(self):
         """Test user model has table name."""
-        try:
-            from tradingbot.models.user import User
-
-            assert hasattr(User, "__tablename__")
-        except (ImportError, AttributeError):
-            pytest.skip("User model table name not available")
+        user = pytest.importorskip("tradingbot.models.user")
+        assert hasattr(user.User, "__tablename__")
 
 
 class TestStrategyModel:
     """Test strategy model functionality."""
 
-    def test_strategy_model_import(self):
-        """Test that strategy model can be imported."""
-        try:
-            from tradingbot.models.strategy import Strategy
-
-            assert Strategy is not None
-        except ImportError:
-            pytest.skip("Strategy model not available")
-
     def test_strategy_model_attributes(self):
         """Test strategy model has expected attributes."""
-        try:
-            from tradingbot.models.strategy import Strategy
-
-            assert hasattr(Strategy, "__tablename__")
-        except (ImportError, AttributeError):
-            pytest.skip("Strategy model attributes not available")
+        strategy = pytest.importorskip("tradingbot.models.strategy")
+        assert hasattr(strategy.Strategy, "__tablename__")
 
 
 class TestMarketModel:
     """Test market data model functionality."""
 
-    def test_market_model_import(self):
-        """Test that market model can be imported."""
-        try:
-            from tradingbot.models.market import MarketData
-
-            assert MarketData is not None
-        except ImportError:
-            pytest.skip("Market model not available")
-
     def test_market_data_creation(self):
         """Test market data model creation."""
-        try:
-            from tradingbot.models.market import MarketData
-
-            # Test that we can create a mock instance
-            market_data = MagicMock(spec=MarketData)
-            assert market_data is not None
-        except ImportError:
-            pytest.skip("Market model not available")
+        market = pytest.importorskip("tradingbot.models.market")
+        # Test that we can create a mock instance
+        market_data = MagicMock(spec=market.MarketData)
+        assert market_data is not None
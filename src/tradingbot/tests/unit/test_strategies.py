@@ -0,0 +1,231 @@
+"""Unit tests for strategy implementations."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingbot.strategies.base_strategy import SignalResult
+from tradingbot.strategies.implementations.multi_indicator import (
+    MultiIndicatorStrategy,
+)
+from tradingbot.strategies.implementations.rsi_reversal import RSIReversalStrategy
+from tradingbot.strategies.indicators import IndicatorCache, TechnicalIndicators
+from tradingbot.strategies.registry import registry
+
+
+class TestMultiIndicatorStrategy:
+    """Test the multi-indicator strategy."""
+
+    def test_confirmation_counts(self, ohlcv):
+        """Test confirmation counts match the individual indicator flags."""
+        df = MultiIndicatorStrategy().compute_signals(ohlcv)
+
+        bullish = df[
+            ["rsi_bullish", "macd_bullish", "bb_bullish", "macd_momentum_bullish"]
+        ].sum(axis=1)
+        bearish = df[
+            ["rsi_bearish", "macd_bearish", "bb_bearish", "macd_momentum_bearish"]
+        ].sum(axis=1)
+
+        np.testing.assert_array_equal(df["bullish_count"], bullish)
+        np.testing.assert_array_equal(df["bearish_count"], bearish)
+        assert df["bullish_count"].dtype == np.int8
+        net = df["bullish_count"] - df["bearish_count"]
+        np.testing.assert_array_equal(net, bullish - bearish)
+
+    def test_streaming_update_matches_batch(self, ohlcv):
+        """Test bar-by-bar updates reproduce the batch computation."""
+        strategy = MultiIndicatorStrategy()
+        batch = strategy.compute_signals(ohlcv)
+
+        streamed = pd.DataFrame(
+            [strategy.update(bar) for bar in ohlcv.to_dict("records")],
+            index=ohlcv.index,
+        )
+
+        np.testing.assert_array_equal(streamed["signal"], batch["signal"])
+        for column in ["rsi", "macd_histogram", "bb_upper", "atr", "stop_loss_level"]:
+            np.testing.assert_allclose(
+                streamed[column], batch[column], rtol=1e-7, atol=1e-7
+            )
+
+    def test_input_not_modified(self, ohlcv):
+        """Test that computing signals leaves the input frame untouched."""
+        original = ohlcv.copy()
+        df = MultiIndicatorStrategy().compute_signals(ohlcv)
+
+        pd.testing.assert_frame_equal(ohlcv, original)
+        pd.testing.assert_frame_equal(df[original.columns], original)
+
+    def test_indicator_cache_tracks_input_changes(self, ohlcv):
+        """Test cached indicators are recomputed when any bar changes."""
+        cache = IndicatorCache()
+        first = MultiIndicatorStrategy(indicator_cache=cache).compute_signals(ohlcv)
+        cached = len(cache)
+        sweep = MultiIndicatorStrategy(
+            params={"min_confirmations": 1}, indicator_cache=cache
+        )
+        np.testing.assert_array_equal(sweep.compute_signals(ohlcv)["rsi"], first["rsi"])
+        assert len(cache) == cached
+
+        ohlcv.iloc[150, ohlcv.columns.get_loc("close")] *= 1.5
+        changed = MultiIndicatorStrategy(indicator_cache=cache).compute_signals(ohlcv)
+        fresh = MultiIndicatorStrategy(
+            indicator_cache=IndicatorCache()
+        ).compute_signals(ohlcv)
+
+        assert changed["rsi"].iloc[150] != first["rsi"].iloc[150]
+        np.testing.assert_array_equal(changed["rsi"], fresh["rsi"])
+        np.testing.assert_array_equal(changed["atr"], fresh["atr"])
+
+    def test_float32_precision(self, ohlcv):
+        """Test the opt-in float32 path matches the float64 signals."""
+        reference = MultiIndicatorStrategy().compute_signals(ohlcv)
+        df = MultiIndicatorStrategy(params={"dtype": "float32"}).compute_signals(ohlcv)
+
+        assert df["rsi"].dtype == np.float32
+        assert df["stop_loss_level"].dtype == np.float32
+        np.testing.assert_array_equal(df["signal"], reference["signal"])
+        np.testing.assert_allclose(df["rsi"], reference["rsi"], rtol=1e-5)
+
+    def test_signal_grid_matches_individual_runs(self, ohlcv):
+        """Test grid signals match one strategy per parameter combination."""
+        grid = {"min_confirmations": [1, 2], "rsi_oversold": [25, 35]}
+        signals = MultiIndicatorStrategy().compute_signals_grid(ohlcv, grid)
+
+        assert signals.shape == (len(ohlcv), 4)
+        assert (signals.dtypes == np.int8).all()
+        for min_conf, rsi_os in signals.columns:
+            params = {"min_confirmations": min_conf, "rsi_oversold": rsi_os}
+            df = MultiIndicatorStrategy(params=params).compute_signals(ohlcv)
+            np.testing.assert_array_equal(signals[(min_conf, rsi_os)], df["signal"])
+
+        for bad_grid in ({"rsi_period": [7]}, {}, {"rsi_oversold": []}):
+            with pytest.raises(ValueError, match="grid|swept"):
+                MultiIndicatorStrategy().compute_signals_grid(ohlcv, bad_grid)
+
+    def test_lean_result_matches_frame(self, ohlcv):
+        """Test the lean result carries the same signals and levels."""
+        strategy = MultiIndicatorStrategy()
+        df = strategy.compute_signals(ohlcv)
+        result = strategy.compute_signals(ohlcv, lean=True)
+
+        assert isinstance(result, SignalResult)
+        np.testing.assert_array_equal(result.signal, df["signal"])
+        np.testing.assert_array_equal(result.strength, df["signal_strength"])
+        np.testing.assert_array_equal(result.stop_loss, df["stop_loss_level"])
+        np.testing.assert_array_equal(result.take_profit, df["take_profit_level"])
+
+    def test_insufficient_data(self, ohlcv):
+        """Test that too little data is rejected."""
+        with pytest.raises(ValueError):
+            MultiIndicatorStrategy().compute_signals(ohlcv.iloc[:10])
+
+
+class TestRSIReversalStrategy:
+    """Test the RSI reversal strategy."""
+
+    def test_signals_are_rsi_crossovers(self, ohlcv):
+        """Test buy/sell signals occur on threshold crossovers."""
+        strategy = RSIReversalStrategy()
+        df = strategy.compute_signals(ohlcv)
+
+        rsi = df["rsi"]
+        buys = (rsi > strategy.oversold_threshold) & (
+            rsi.shift(1) <= strategy.oversold_threshold
+        )
+        sells = (rsi < strategy.overbought_threshold) & (
+            rsi.shift(1) >= strategy.overbought_threshold
+        )
+
+        np.testing.assert_array_equal(df["signal"] == 1, buys)
+        np.testing.assert_array_equal(df["signal"] == -1, sells)
+
+    def test_lean_result_matches_frame(self, ohlcv):
+        """Test the lean result carries the same signals and levels."""
+        strategy = RSIReversalStrategy()
+        df = strategy.compute_signals(ohlcv)
+        result = strategy.compute_signals(ohlcv, lean=True)
+
+        np.testing.assert_array_equal(result.signal, df["signal"])
+        np.testing.assert_array_equal(result.strength, df["signal"].abs())
+        np.testing.assert_array_equal(result.stop_loss, df["stop_loss_level"])
+        np.testing.assert_array_equal(result.take_profit, df["take_profit_level"])
+
+    def test_zone_and_divergence_are_categorical(self, ohlcv):
+        """Test zone/divergence columns are compact categoricals."""
+        strategy = RSIReversalStrategy()
+        df = strategy.compute_signals(ohlcv)
+
+        assert df["rsi_zone"].cat.codes.dtype == np.int8
+        assert list(df["rsi_zone"].cat.categories) == strategy.RSI_ZONES
+        assert list(df["divergence"].cat.categories) == strategy.DIVERGENCES
+        np.testing.assert_array_equal(
+            df["rsi_zone"] == "oversold", df["rsi"] <= strategy.oversold_threshold
+        )
+
+
+class TestStrategyRegistry:
+    """Test the strategy registry."""
+
+    def test_strategy_info_is_a_copy(self):
+        """Test mutating returned info leaves the registry unchanged."""
+        info = registry.get_strategy_info("rsi_reversal")
+        info["name"] = "changed"
+        registry.get_all_strategies_info()["rsi_reversal"]["class"] = "changed"
+
+        info = registry.get_strategy_info("rsi_reversal")
+        assert info["name"] == "rsi_reversal"
+        assert info["class"] == RSIReversalStrategy.__name__
+
+
+class TestIndicatorCache:
+    """Test indicator sharing between strategies."""
+
+    def test_ensemble_shares_rsi(self, ohlcv):
+        """Test strategies with a shared cache compute RSI only once."""
+        cache = IndicatorCache()
+        multi = MultiIndicatorStrategy(indicator_cache=cache).compute_signals(ohlcv)
+        cached = len(cache)
+
+        reversal = RSIReversalStrategy(indicator_cache=cache).compute_signals(ohlcv)
+
+        assert len(cache) == cached
+        np.testing.assert_array_equal(reversal["rsi"], multi["rsi"])
+
+
+class TestTechnicalIndicators:
+    """Test the indicator functions."""
+
+    def test_float32_dtype(self, ohlcv):
+        """Test the float32 path returns float32 close to the float64 values."""
+        high, low, close = ohlcv["high"], ohlcv["low"], ohlcv["close"]
+        for indicator, args in [
+            (TechnicalIndicators.rsi, (close,)),
+            (TechnicalIndicators.macd, (close,)),
+            (TechnicalIndicators.stochastic_oscillator, (high, low, close)),
+            (TechnicalIndicators.commodity_channel_index, (high, low, close)),
+        ]:
+            reference = indicator(*args)
+            result = indicator(*args, dtype=np.float32)
+            if not isinstance(result, tuple):
+                reference, result = (reference,), (result,)
+            for expected, actual in zip(reference, result):
+                assert actual.dtype == np.float32
+                np.testing.assert_allclose(actual, expected, rtol=1e-4, atol=1e-3)
+
+    def test_batch_matches_single_series(self, ohlcv):
+        """Test batched indicators match the per-series computation."""
+        prices = ohlcv[["open", "high", "low", "close"]]
+        batch = TechnicalIndicators.rsi_batch(prices)
+
+        pd.testing.assert_index_equal(batch.columns, prices.columns)
+        for column in prices:
+            np.testing.assert_array_equal(
+                batch[column], TechnicalIndicators.rsi(prices[column])
+            )
+
+        sma = TechnicalIndicators.simple_moving_average_batch(prices.to_numpy(), 20)
+        np.testing.assert_array_equal(
+            sma[:, 3], TechnicalIndicators.simple_moving_average(prices["close"], 20)
+        )
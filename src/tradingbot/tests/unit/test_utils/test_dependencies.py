@@ -0,0 +1,209 @@
+"""Unit tests for the FastAPI dependencies."""
+
+import dataclasses
+import inspect
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from tradingbot.services import user_service as user_service_module
+from tradingbot.services.auth_service import auth_service
+from tradingbot.utils import dependencies, user_cache
+
+
+def make_token(subject, expires_in=3600):
+    """Access token for a user id, signed with a test key."""
+    return jwt.encode({"sub": subject, "exp": int(time.time()) + expires_in}, "test")
+
+
+class TestUserCache:
+    """Test the per-token cache of resolved users."""
+
+    @pytest.fixture(autouse=True)
+    def users(self, monkeypatch):
+        """Resolve tokens against an in-memory user table and count lookups."""
+        users = {
+            user_id: SimpleNamespace(
+                id=user_id,
+                username=user_id,
+                email=f"{user_id}@example.com",
+                is_active=True,
+                is_admin=False,
+            )
+            for user_id in ("alice", "bob")
+        }
+        lookups = []
+
+        def get_current_user(token):
+            lookups.append(token)
+            return users[jwt.get_unverified_claims(token)["sub"]]
+
+        monkeypatch.setattr(auth_service, "get_current_user", get_current_user)
+        user_cache.invalidate_user_cache()
+        yield SimpleNamespace(table=users, lookups=lookups)
+        user_cache.invalidate_user_cache()
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Monotonic clock the test can move forward."""
+        clock = SimpleNamespace(now=1000.0)
+        monkeypatch.setattr(
+            dependencies,
+            "time",
+            SimpleNamespace(monotonic=lambda: clock.now, time=time.time),
+        )
+        return clock
+
+    def test_cache_hit(self, users):
+        """Test a token is looked up once and then served from the cache."""
+        token = make_token("alice")
+        first = dependencies._resolve_user(token)
+
+        assert dependencies._resolve_user(token) is first
+        assert users.lookups == [token]
+
+    def test_snapshot_is_read_only(self, users):
+        """Test requests share an immutable snapshot, not the ORM object."""
+        user = dependencies._resolve_user(make_token("alice"))
+
+        assert isinstance(user, user_cache.CachedUser)
+        assert user.email == "alice@example.com"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            user.is_admin = True
+
+    def test_lookups_run_off_the_event_loop(self):
+        """Test dependencies that may query the database are not coroutines."""
+        for dependency in (
+            dependencies.get_current_user,
+            dependencies.get_current_admin_user,
+            dependencies.get_optional_current_user,
+        ):
+            assert not inspect.iscoroutinefunction(dependency)
+
+    def test_ttl_expiry(self, users, clock):
+        """Test entries are looked up again once the TTL has passed."""
+        token = make_token("alice")
+        dependencies._resolve_user(token)
+
+        clock.now += user_cache.USER_CACHE_TTL_SECONDS - 1
+        dependencies._resolve_user(token)
+        assert len(users.lookups) == 1
+
+        clock.now += 2
+        dependencies._resolve_user(token)
+        assert len(users.lookups) == 2
+
+    def test_token_expiry(self, users, clock):
+        """Test an entry never outlives the token's exp claim."""
+        token = make_token("alice", expires_in=10)
+        dependencies._resolve_user(token)
+
+        clock.now += 11
+        dependencies._resolve_user(token)
+        assert len(users.lookups) == 2
+
+    def test_eviction(self, users, monkeypatch):
+        """Test the oldest token is evicted once the cache is full."""
+        monkeypatch.setattr(user_cache, "USER_CACHE_MAXSIZE", 2)
+        tokens = [make_token("alice", expires_in=3600 + i) for i in range(3)]
+        for token in tokens:
+            dependencies._resolve_user(token)
+
+        assert list(user_cache._user_cache) == tokens[1:]
+        dependencies._resolve_user(tokens[0])
+        assert len(users.lookups) == 4
+
+    def test_invalidate_user(self, users):
+        """Test invalidating one user drops only that user's tokens."""
+        alice, bob = make_token("alice"), make_token("bob")
+        dependencies._resolve_user(alice)
+        dependencies._resolve_user(bob)
+
+        users.table["alice"].is_active = False
+        user_cache.invalidate_user_cache("alice")
+
+        assert list(user_cache._user_cache) == [bob]
+        assert not dependencies._resolve_user(alice).is_active
+
+    def test_invalidate_all(self, users):
+        """Test invalidating without a user empties the cache."""
+        dependencies._resolve_user(make_token("alice"))
+        dependencies._resolve_user(make_token("bob"))
+        user_cache.invalidate_user_cache()
+
+        assert not user_cache._user_cache
+
+    def test_deactivation_invalidates(self, users, monkeypatch):
+        """Test deactivating a user stops its cached admin access."""
+        users.table["alice"].is_admin = True
+        token = make_token("alice")
+        dependencies._resolve_user(token)
+
+        @contextmanager
+        def get_db_session():
+            query = SimpleNamespace(first=lambda: users.table["alice"])
+            query.filter = lambda *args: query
+            yield SimpleNamespace(query=lambda model: query)
+
+        monkeypatch.setattr(user_service_module, "get_db_session", get_db_session)
+        user_service_module.user_service.deactivate_user("alice")
+
+        assert not user_cache._user_cache
+        assert not dependencies._resolve_user(token).is_active
+
+
+class TestRateLimit:
+    """Test the rate limit dependency with a stubbed Redis script."""
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        """Install a script stub whose outcome each test sets."""
+        calls = SimpleNamespace(keys=[], outcome=0)
+
+        async def script(keys, args):
+            calls.keys.extend(keys)
+            if isinstance(calls.outcome, Exception):
+                raise calls.outcome
+            return calls.outcome
+
+        monkeypatch.setattr(dependencies, "_rate_limit_script", lambda: script)
+        return calls
+
+    @pytest.fixture
+    def client(self):
+        """App with one endpoint behind the API rate limit."""
+        app = FastAPI()
+
+        @app.get("/limited", dependencies=[Depends(dependencies.rate_limit_api)])
+        def limited():
+            return {"ok": True}
+
+        return TestClient(app)
+
+    def test_allowed(self, client, calls):
+        """Test a request with a token left goes through."""
+        assert client.get("/limited").status_code == 200
+        assert calls.keys == ["rate_limit:100/60:testclient"]
+
+    def test_limited(self, client, calls):
+        """Test an empty bucket answers 429 with the wait rounded up."""
+        calls.outcome = 1500
+        response = client.get("/limited")
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "2"
+
+    def test_fails_open_on_redis_error(self, client, calls):
+        """Test requests go through when Redis cannot be reached."""
+        calls.outcome = ConnectionError("redis down")
+        assert client.get("/limited").status_code == 200
+
+    def test_disabled_without_redis(self, client, monkeypatch):
+        """Test requests go through when Redis is not configured."""
+        monkeypatch.setattr(dependencies, "_rate_limit_script", lambda: None)
+        assert client.get("/limited").status_code == 200
@@ -3,17 +3,16 @@ Datetime utilities for Python version compatibility.
 Provides consistent datetime handling across Python 3.10-3.12.
 """
 
-import sys
+from __future__ import annotations
+
+import datetime as _datetime
 from datetime import datetime, timezone
 
-# Python version compatibility for UTC
-if sys.version_info >= (3, 11):
-    try:
-        from datetime import UTC
-    except ImportError:
-        UTC = UTC
-else:
-    UTC = timezone.utc
+# Python version compatibility for UTC (datetime.UTC is new in Python 3.11)
+UTC = getattr(_datetime, "UTC", timezone.utc)
+
+# Bound once so each call skips the attribute lookup
+_now = datetime.now
 
 
 def utcnow() -> datetime:
@@ -25,14 +24,8 @@ def utcnow() -> datetime:
     Returns:
         datetime: Current UTC datetime with timezone info
     """
-    return datetime.now(UTC)
+    return _now(UTC)
 
 
-def utc_timestamp() -> datetime:
-    """
-    Get current UTC timestamp.
-
-    Returns:
-        datetime: Current UTC datetime with timezone info
-    """
-    return datetime.now(UTC)
+# Same function under its former name
+utc_timestamp = utcnow
@@ -1,25 +1,99 @@
 """
 FastAPI dependencies for the Crypto Trading Bot application.
 Contains reusable dependencies for authentication, pagination, etc.
+
+The database, models, schemas and auth service are imported on first use, so
+importing this module only pulls in FastAPI. Set ``EAGER_IMPORT=1`` to import
+them up front (e.g. in CI, to surface broken imports at startup).
 """
 
-from typing import Optional
+import importlib
+import logging
+import os
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterator, Literal, NamedTuple, Optional
 
-from fastapi import Depends, HTTPException, Query, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
 
-from ..database.connection import get_session
-from ..models.user import User
-from ..schemas.common import PaginationParams
-from ..services.auth_service import auth_service
+from .user_cache import (
+    USER_CACHE_TTL_SECONDS,
+    CachedUser,
+    cache_user,
+    get_cached_user,
+)
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from ..schemas.common import PaginationParams
+
+# Module attributes resolved on first access: name -> (module, attribute)
+_LAZY_IMPORTS = {
+    "auth_service": ("..services.auth_service", "auth_service"),
+    "PaginationParams": ("..schemas.common", "PaginationParams"),
+    "Session": ("sqlalchemy.orm", "Session"),
+    "User": ("..models.user", "User"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a deferred module attribute and cache it in the module namespace."""
+    try:
+        module_name, attribute = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __package__), attribute)
+    globals()[name] = value
+    return value
+
+
+# Bearer schemes shared by every dependency that reads the token
+_BEARER = HTTPBearer()
+_BEARER_OPTIONAL = HTTPBearer(auto_error=False)
+security = _BEARER
+
+
+def _resolve_user(token: str) -> CachedUser:
+    """
+    Resolve the user for an access token, reusing a recent lookup.
+
+    Entries expire after ``USER_CACHE_TTL_SECONDS``, or earlier when the
+    token itself expires. A miss decodes the token and queries the database,
+    so callers must not run on the event loop.
+
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    now = time.monotonic()
+    user = get_cached_user(token, now)
+    if user is not None:
+        return user
+
+    from jose import jwt
+
+    from ..services.auth_service import auth_service
 
-security = HTTPBearer()
+    user = CachedUser.from_user(auth_service.get_current_user(token))
 
+    expires = now + USER_CACHE_TTL_SECONDS
+    token_exp = jwt.get_unverified_claims(token).get("exp")
+    if token_exp is not None:
+        expires = min(expires, now + token_exp - time.time())
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> User:
+    cache_user(token, user, expires)
+    return user
+
+
+# Plain functions, so FastAPI runs the possibly blocking lookup in its
+# threadpool. They return read-only snapshots shared between requests.
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(_BEARER),
+) -> CachedUser:
     """
     Get current authenticated user from access token.
 
@@ -27,19 +101,17 @@ async def get_current_user(
         credentials: HTTP Bearer token credentials
 
     Returns:
-        User: Current authenticated user
+        CachedUser: Read-only snapshot of the current user
 
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    token = credentials.credentials
-    user = await auth_service.get_current_user(token)
-    return user
+    return _resolve_user(credentials.credentials)
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: CachedUser = Depends(get_current_user),
+) -> CachedUser:
     """
     Get current active user (must be active).
 
@@ -47,7 +119,7 @@ async def get_current_active_user(
         current_user: Current authenticated user
 
     Returns:
-        User: Current active user
+        CachedUser: Read-only snapshot of the current active user
 
     Raises:
         HTTPException: If user is inactive
@@ -59,21 +131,29 @@ async def get_current_active_user(
     return current_user
 
 
-async def get_current_admin_user(
-    current_user: User = Depends(get_current_active_user),
-) -> User:
+def get_current_admin_user(
+    credentials: HTTPAuthorizationCredentials = Depends(_BEARER),
+) -> CachedUser:
     """
     Get current admin user (must be active admin).
 
+    Resolves the token and checks both flags itself rather than chaining
+    through ``get_current_active_user``, so the admin path is one dependency.
+
     Args:
-        current_user: Current active user
+        credentials: HTTP Bearer token credentials
 
     Returns:
-        User: Current admin user
+        CachedUser: Read-only snapshot of the current admin user
 
     Raises:
-        HTTPException: If user is not admin
+        HTTPException: If token is invalid, or user is inactive or not admin
     """
+    current_user = _resolve_user(credentials.credentials)
+    if not current_user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
+        )
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
@@ -81,11 +161,9 @@ async def get_current_admin_user(
     return current_user
 
 
-async def get_optional_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(
-        HTTPBearer(auto_error=False)
-    ),
-) -> Optional[User]:
+def get_optional_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_BEARER_OPTIONAL),
+) -> Optional[CachedUser]:
     """
     Get current user if token is provided, None otherwise.
 
@@ -93,35 +171,40 @@ async def get_optional_current_user(
         credentials: Optional HTTP Bearer token credentials
 
     Returns:
-        Optional[User]: Current user if authenticated, None otherwise
+        Optional[CachedUser]: Snapshot of the current user if authenticated,
+            None otherwise
     """
     if not credentials:
         return None
 
     try:
-        token = credentials.credentials
-        user = await auth_service.get_current_user(token)
-        return user
+        return _resolve_user(credentials.credentials)
     except HTTPException:
         return None
 
 
-def get_db_session() -> Session:
+def get_db_session() -> Iterator["Session"]:
     """
     Get database session.
 
-    Returns:
+    A generator dependency, so FastAPI commits or rolls back and closes the
+    session itself once the response is sent.
+
+    Yields:
         Session: Database session
     """
-    return get_session()
+    from ..database.connection import db_manager
+
+    with db_manager.get_session() as session:
+        yield session
 
 
 def get_pagination_params(
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(20, ge=1, le=100, description="Page size"),
     sort_by: Optional[str] = Query(None, description="Sort field"),
-    sort_order: str = Query("asc", regex="^(asc|desc)$", description="Sort order"),
-) -> PaginationParams:
+    sort_order: Literal["asc", "desc"] = Query("asc", description="Sort order"),
+) -> "PaginationParams":
     """
     Get pagination parameters.
 
@@ -134,16 +217,34 @@ def get_pagination_params(
     Returns:
         PaginationParams: Pagination parameters
     """
+    return _pagination_params(page, size, sort_by, sort_order)
+
+
+@lru_cache(maxsize=256)
+def _pagination_params(
+    page: int, size: int, sort_by: Optional[str], sort_order: Literal["asc", "desc"]
+) -> "PaginationParams":
+    """Build pagination parameters, shared between requests with the same query."""
+    from ..schemas.common import PaginationParams
+
     return PaginationParams(
         page=page, size=size, sort_by=sort_by, sort_order=sort_order
     )
 
 
+class SearchParams(NamedTuple):
+    """Search and filter parameters."""
+
+    search_query: Optional[str]
+    filter_by: Optional[str]
+    filter_value: Optional[str]
+
+
 def get_search_params(
     q: Optional[str] = Query(None, description="Search query"),
     filter_by: Optional[str] = Query(None, description="Filter field"),
     filter_value: Optional[str] = Query(None, description="Filter value"),
-) -> dict:
+) -> SearchParams:
     """
     Get search and filter parameters.
 
@@ -153,21 +254,110 @@ def get_search_params(
         filter_value: Value to filter by
 
     Returns:
-        dict: Search and filter parameters
+        SearchParams: Search and filter parameters
+    """
+    return SearchParams(q, filter_by, filter_value)
+
+
+# Token bucket per client, refilled and debited atomically in one round trip.
+# The bucket is a hash of the remaining tokens and the last refill time (ms,
+# taken from the Redis clock so app servers need not agree on the time).
+# KEYS[1]: bucket key; ARGV: capacity, refill rate (tokens/ms), expiry (ms)
+# Returns 0 when the request is allowed, else the ms until a token is free.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = clock[1] * 1000 + math.floor(clock[2] / 1000)
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local elapsed = math.max(0, now - (tonumber(bucket[2]) or now))
+tokens = math.min(capacity, tokens + elapsed * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+return wait
+"""
+
+
+# Connections allowed in the pool shared by all rate limit dependencies
+RATE_LIMIT_MAX_CONNECTIONS = 64
+
+
+@lru_cache(maxsize=None)
+def _rate_limit_script():
+    """
+    Register the token bucket script on a client backed by one shared pool.
+
+    Built once on first use, so every ``RateLimitDependency`` reuses the same
+    connections instead of opening its own.
+
+    Returns:
+        The registered script, or None when Redis is disabled or unavailable
     """
-    return {"search_query": q, "filter_by": filter_by, "filter_value": filter_value}
+    from ..config.settings import get_settings
+
+    settings = get_settings()
+    if not settings.USE_REDIS:
+        return None
+    try:
+        import redis.asyncio as redis
+    except ImportError:
+        logger.error("❌ USE_REDIS is set but redis is not installed")
+        return None
+
+    pool = redis.ConnectionPool.from_url(
+        settings.REDIS_URL, max_connections=RATE_LIMIT_MAX_CONNECTIONS
+    )
+    return redis.Redis(connection_pool=pool).register_script(TOKEN_BUCKET_SCRIPT)
 
 
 class RateLimitDependency:
-    """Rate limiting dependency."""
+    """
+    Rate limiting dependency.
+
+    Each client gets a token bucket of ``max_requests`` tokens refilled over
+    ``window_seconds``, kept in Redis and checked with a single script call.
+    Requests are let through when Redis is disabled (``USE_REDIS``), the
+    ``redis`` package is not installed, or the server cannot be reached.
+    """
 
     def __init__(self, max_requests: int = 100, window_seconds: int = 60):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        # TODO: Implement rate limiting logic with Redis
+        # Script arguments are the same on every call
+        self._script_args = (
+            max_requests,
+            max_requests / (window_seconds * 1000),
+            window_seconds * 1000,
+        )
+        self._key_prefix = f"rate_limit:{max_requests}/{window_seconds}:"
+
+    async def __call__(self, request: Request):
+        script = _rate_limit_script()
+        if script is None:
+            return True
+
+        client = request.client.host if request.client else "unknown"
+        try:
+            wait_ms = await script(
+                keys=[self._key_prefix + client], args=self._script_args
+            )
+        except Exception as e:
+            logger.warning(f"Rate limit check skipped, Redis unavailable: {e}")
+            return True
 
-    async def __call__(self, request):
-        # TODO: Implement rate limiting check
+        if wait_ms:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests",
+                headers={"Retry-After": str(-(-int(wait_ms) // 1000))},
+            )
         return True
 
 
@@ -176,11 +366,15 @@ class PermissionChecker:
 
     def __init__(self, required_permission: str):
         self.required_permission = required_permission
+        # Fixed per permission, so decided once rather than on every request
+        self.requires_admin = required_permission.startswith("admin:")
 
-    async def __call__(self, current_user: User = Depends(get_current_active_user)):
+    async def __call__(
+        self, current_user: CachedUser = Depends(get_current_active_user)
+    ):
         # TODO: Implement permission checking logic
         # For now, just check if user is admin for admin permissions
-        if self.required_permission.startswith("admin:") and not current_user.is_admin:
+        if self.requires_admin and not current_user.is_admin:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
             )
@@ -197,3 +391,7 @@ require_trading = PermissionChecker("user:trading")
 rate_limit_auth = RateLimitDependency(max_requests=10, window_seconds=60)
 rate_limit_api = RateLimitDependency(max_requests=100, window_seconds=60)
 rate_limit_trading = RateLimitDependency(max_requests=50, window_seconds=60)
+
+if os.environ.get("EAGER_IMPORT") == "1":
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
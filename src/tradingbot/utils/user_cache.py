@@ -0,0 +1,92 @@
+"""
+Short-lived cache of users resolved from access tokens.
+
+Imports nothing from the web or service layers, so services can invalidate
+entries after changing an account without depending on the FastAPI module.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+# Users resolved from access tokens are reused across requests for a short
+# while, skipping the JWT decode and database lookup
+USER_CACHE_TTL_SECONDS = 60
+USER_CACHE_MAXSIZE = 10_000
+
+
+@dataclass(slots=True, frozen=True)
+class CachedUser:
+    """
+    Read-only snapshot of the user fields request handling needs.
+
+    The same instance is handed to concurrent requests, so it is immutable
+    and detached from any database session.
+    """
+
+    id: str
+    username: str
+    email: str
+    is_active: bool
+    is_admin: bool
+
+    @classmethod
+    def from_user(cls, user: Any) -> "CachedUser":
+        """Snapshot a ``User`` model instance."""
+        return cls(user.id, user.username, user.email, user.is_active, user.is_admin)
+
+
+# token -> (monotonic expiry time, user)
+_user_cache: Dict[str, Tuple[float, CachedUser]] = {}
+# Services invalidate from worker threads while requests resolve users
+_user_cache_lock = threading.Lock()
+
+
+def get_cached_user(token: str, now: float) -> Optional[CachedUser]:
+    """
+    Return the cached user for a token, or None if absent or expired.
+
+    Args:
+        token: Access token
+        now: Current ``time.monotonic()`` value
+    """
+    with _user_cache_lock:
+        entry = _user_cache.pop(token, None)
+        if entry is None or entry[0] <= now:
+            return None
+        _user_cache[token] = entry
+        return entry[1]
+
+
+def cache_user(token: str, user: CachedUser, expires: float) -> None:
+    """
+    Cache a user for a token until a monotonic expiry time.
+
+    Args:
+        token: Access token
+        user: Snapshot of the resolved user
+        expires: ``time.monotonic()`` value after which the entry is stale
+    """
+    with _user_cache_lock:
+        if len(_user_cache) >= USER_CACHE_MAXSIZE:
+            # Oldest entries come first
+            del _user_cache[next(iter(_user_cache))]
+        _user_cache[token] = (expires, user)
+
+
+def invalidate_user_cache(user_id: Optional[str] = None) -> None:
+    """
+    Forget cached users, e.g. after an account was changed or logged out.
+
+    Args:
+        user_id: User whose tokens to forget; all users when omitted
+    """
+    with _user_cache_lock:
+        if user_id is None:
+            _user_cache.clear()
+            return
+        stale = [
+            token for token, (_, user) in _user_cache.items() if user.id == user_id
+        ]
+        for token in stale:
+            del _user_cache[token]
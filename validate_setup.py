@@ -6,10 +6,15 @@ This script validates that the project has been set up correctly with all
 dependencies, configuration files, and basic functionality working.
 """
 
+import os
 import sys
 import subprocess
-import importlib
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Environment of the probe subprocesses: they must not write bytecode caches
+# into the project being validated
+PROBE_ENV = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
 
 
 def check_python_version():
@@ -26,6 +31,19 @@ def check_python_version():
         return False
 
 
+@lru_cache(maxsize=None)
+def directory_entries(directory):
+    """List a directory once, as (file names, subdirectory names)"""
+    files, dirs = set(), set()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                (dirs if entry.is_dir() else files).add(entry.name)
+    except OSError:
+        pass
+    return frozenset(files), frozenset(dirs)
+
+
 def check_required_files():
     """Check if all required configuration files exist"""
     print("\n📁 Checking required files...")
@@ -44,8 +62,9 @@ def check_required_files():
 
     all_exist = True
     for file_path in required_files:
-        path = Path(file_path)
-        if path.exists():
+        parent, name = os.path.split(file_path)
+        files, dirs = directory_entries(parent or ".")
+        if name in files or name in dirs:
             print(f"   ✅ {file_path}")
         else:
             print(f"   ❌ {file_path} - Missing")
@@ -66,18 +85,36 @@ def check_dependencies():
         "numpy",
     ]
 
+    # Probe all packages concurrently, each in its own interpreter, so the
+    # validator never loads them itself
+    with ThreadPoolExecutor(max_workers=len(required_packages)) as pool:
+        installed = list(pool.map(probe_import, required_packages))
+
     all_imported = True
-    for package in required_packages:
-        try:
-            importlib.import_module(package)
+    for package, ok in zip(required_packages, installed):
+        if ok:
             print(f"   ✅ {package}")
-        except ImportError:
+        else:
             print(f"   ❌ {package} - Not installed")
             all_imported = False
 
     return all_imported
 
 
+def probe_import(package):
+    """Check whether a package can be imported in a fresh interpreter"""
+    try:
+        result = subprocess.run(
+            [sys.executable, "-c", f"import {package}"],
+            capture_output=True,
+            timeout=10,
+            env=PROBE_ENV,
+        )
+    except subprocess.TimeoutExpired:
+        return False
+    return result.returncode == 0
+
+
 def check_project_structure():
     """Check if the project structure is correct"""
     print("\n🏗️ Checking project structure...")
@@ -94,8 +131,9 @@ def check_project_structure():
 
     all_exist = True
     for dir_path in required_dirs:
-        path = Path(dir_path)
-        if path.exists() and path.is_dir():
+        parent, name = os.path.split(dir_path)
+        _, dirs = directory_entries(parent or ".")
+        if name in dirs:
             print(f"   ✅ {dir_path}/")
         else:
             print(f"   ❌ {dir_path}/ - Missing")
@@ -104,60 +142,71 @@ def check_project_structure():
     return all_exist
 
 
-def check_app_import():
-    """Check if the main application can be imported"""
-    print("\n🚀 Checking application import...")
+# Script run by probe_app: imports the app and loads the settings in a single
+# interpreter, printing one "<CHECK>_OK" or "<CHECK>_FAIL <error>" line each
+APP_PROBE_SCRIPT = """
+import sys
+sys.path.insert(0, "src")
+try:
+    from tradingbot import main
+    print("APP_OK")
+except Exception as e:
+    print("APP_FAIL", repr(e))
+try:
+    from tradingbot.config.settings import get_settings
+    get_settings()
+    print("CFG_OK")
+except Exception as e:
+    print("CFG_FAIL", repr(e))
+"""
+
+
+@lru_cache(maxsize=None)
+def probe_app():
+    """Run the app and settings checks in one subprocess, once per run"""
     try:
-        # Test import via subprocess to avoid import path issues
         result = subprocess.run(
-            [
-                sys.executable,
-                "-c",
-                "import sys; import os; os.chdir('src/tradingbot'); import main; print('Import successful')",
-            ],
+            [sys.executable, "-c", APP_PROBE_SCRIPT],
             capture_output=True,
             text=True,
-            timeout=10,
-            cwd=".",
+            timeout=20,
+            env=PROBE_ENV,
         )
-
-        if result.returncode == 0 and "Import successful" in result.stdout:
-            print("   ✅ FastAPI app imported successfully")
-            return True
-        else:
-            print(
-                f"   ❌ Failed to import app: {result.stderr.strip() if result.stderr else 'Unknown error'}"
-            )
-            return False
     except Exception as e:
-        print(f"   ❌ Import test failed: {e}")
+        return {"APP": f"Import test failed: {e}", "CFG": f"Test execution failed: {e}"}
+
+    # Checks that never reported (e.g. the interpreter crashed) fail with stderr
+    error = result.stderr.strip() or "Unknown error"
+    outcomes = {"APP": error, "CFG": error}
+    for line in result.stdout.splitlines():
+        status, _, detail = line.partition(" ")
+        check, _, verdict = status.partition("_")
+        if check in outcomes and verdict in ("OK", "FAIL"):
+            outcomes[check] = None if verdict == "OK" else detail
+    return outcomes
+
+
+def check_app_import():
+    """Check if the main application can be imported"""
+    print("\n🚀 Checking application import...")
+    error = probe_app()["APP"]
+    if error is None:
+        print("   ✅ FastAPI app imported successfully")
+        return True
+    else:
+        print(f"   ❌ Failed to import app: {error}")
         return False
 
 
 def run_basic_tests():
     """Run basic functionality tests"""
     print("\n🧪 Running basic tests...")
-    try:
-        # Try to run a quick test
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-c",
-                "import sys; sys.path.insert(0, 'src'); from tradingbot.config.settings import get_settings; settings = get_settings(); print('Settings loaded successfully')",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        if result.returncode == 0:
-            print("   ✅ Configuration loading test passed")
-            return True
-        else:
-            print(f"   ❌ Configuration test failed: {result.stderr}")
-            return False
-    except Exception as e:
-        print(f"   ❌ Test execution failed: {e}")
+    error = probe_app()["CFG"]
+    if error is None:
+        print("   ✅ Configuration loading test passed")
+        return True
+    else:
+        print(f"   ❌ Configuration test failed: {error}")
         return False
 
 